@@ -7,24 +7,21 @@ and export them as configurable JSON files for LLM ingestion.
 """
 
 import argparse
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 from .config import get_fields_to_select, ALL_FIELDS
-from .openalex_client import search_works, lookup_author_id, lookup_institution_id, OpenAlexAPIError, RateLimitError
-from .formatter import format_work, write_json
 from .config_manager import get_email, set_email, get_config_path, get_tavily_api_key as get_config_tavily_key, set_tavily_api_key
-from .name_resolver import (
-    detect_file_format,
-    parse_author_line,
-    resolve_abbreviated_name,
-    get_tavily_api_key,
-)
-from .comp_report import load_and_filter_comp_report
 
+# The API client (and requests), formatter, name resolver and compensation
+# report modules are imported where they are used, so config-only commands
+# like --list-fields and --show-config start without loading them.
 
-def parse_args():
-    """Parse command-line arguments."""
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command-line argument parser."""
     parser = argparse.ArgumentParser(
         description="Query OpenAlex API to fetch scholarly works and export as JSON",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -176,7 +173,16 @@ Examples:
         help="Show current configuration and exit"
     )
     
-    return parser.parse_args()
+    return parser
+
+
+# Built once at import so repeated main() calls don't rebuild it
+_PARSER = _build_parser()
+
+
+def parse_args(argv: Optional[list] = None):
+    """Parse command-line arguments (defaults to sys.argv[1:])."""
+    return _PARSER.parse_args(argv)
 
 
 def list_available_fields():
@@ -198,11 +204,18 @@ def list_available_fields():
         print(f"  - {alias} → {field}")
 
 
+# Concurrent Tavily searches when resolving abbreviated author names
+MAX_RESOLVE_WORKERS = 8
+
+# Comma separator along with any surrounding whitespace
+_FIELD_SPLIT_RE = re.compile(r"\s*,\s*")
+
+
 def parse_field_list(field_string: Optional[str]) -> Optional[list]:
     """Parse comma-separated field list."""
     if not field_string:
         return None
-    return [f.strip() for f in field_string.split(",") if f.strip()]
+    return [f for f in _FIELD_SPLIT_RE.split(field_string.strip()) if f]
 
 
 def resolve_and_lookup_authors(author_entries, institution_name, email, use_tavily, tavily_key):
@@ -219,30 +232,49 @@ def resolve_and_lookup_authors(author_entries, institution_name, email, use_tavi
     Returns:
         List of OpenAlex author ID URL strings
     """
+    from .openalex_client import lookup_author_ids_batch, lookup_institution_id
+    from .name_resolver import resolve_abbreviated_name
+
     institution_id = None
     if institution_name:
         institution_id = lookup_institution_id(institution_name, email)
 
     print(f"Looking up {len(author_entries)} author(s)...", flush=True)
-    author_ids = []
-    found_count = 0
-    for entry in author_entries:
-        name = entry["name"]
 
-        # Try Tavily resolution for abbreviated names
-        if use_tavily and tavily_key:
-            resolved_name, was_resolved = resolve_abbreviated_name(
+    # Resolve names first so the OpenAlex lookups can be batched
+    names = [entry["name"] for entry in author_entries]
+
+    # Try Tavily resolution for abbreviated names; the searches are
+    # network-bound, so run them concurrently
+    if use_tavily and tavily_key:
+        def resolve(key):
+            name, department, college = key
+            return resolve_abbreviated_name(
                 name,
                 institution=institution_name,
-                department=entry.get("department"),
-                college=entry.get("college"),
+                department=department,
+                college=college,
                 tavily_api_key=tavily_key,
             )
+
+        # Entries repeated in the input share one search
+        keys = [(entry["name"], entry.get("department"), entry.get("college")) for entry in author_entries]
+        unique_keys = list(dict.fromkeys(keys))
+        with ThreadPoolExecutor(max_workers=MAX_RESOLVE_WORKERS) as executor:
+            resolutions = dict(zip(unique_keys, executor.map(resolve, unique_keys)))
+
+        for i, key in enumerate(keys):
+            resolved_name, was_resolved = resolutions[key]
             if was_resolved:
-                print(f"  Resolved: {name} -> {resolved_name}", flush=True)
-                name = resolved_name
+                print(f"  Resolved: {names[i]} -> {resolved_name}", flush=True)
+                names[i] = resolved_name
 
-        author_id = lookup_author_id(name, email, institution_id)
+    ids_by_name = lookup_author_ids_batch(names, email, institution_id)
+
+    author_ids = []
+    found_count = 0
+    for name in names:
+        author_id = ids_by_name.get(name)
         if author_id:
             author_ids.append(author_id)
             found_count += 1
@@ -254,9 +286,9 @@ def resolve_and_lookup_authors(author_entries, institution_name, email, use_tavi
     return author_ids
 
 
-def main():
+def main(argv: Optional[list] = None):
     """Main entry point."""
-    args = parse_args()
+    args = parse_args(argv)
     
     # Handle configuration options
     if args.set_email:
@@ -295,10 +327,13 @@ def main():
     use_tavily = not args.no_tavily
     tavily_key = None
     if use_tavily:
+        from .name_resolver import get_tavily_api_key
         tavily_key = get_tavily_api_key(args.tavily_api_key)
 
     # Handle compensation report if provided
     if args.comp_report:
+        from .comp_report import load_and_filter_comp_report
+
         args.csu_only = True  # Comp report implies CSU-only
         try:
             author_entries = load_and_filter_comp_report(
@@ -323,6 +358,8 @@ def main():
 
     # Handle author file if provided
     elif args.author_file:
+        from .name_resolver import detect_file_format, build_header_index, parse_author_line
+
         try:
             with open(args.author_file, "r", encoding="utf-8") as f:
                 lines = [line.rstrip("\n\r") for line in f]
@@ -334,11 +371,12 @@ def main():
             # Detect file format (TSV with headers vs plain text)
             headers = detect_file_format(lines[0])
             data_lines = lines[1:] if headers else lines
+            header_index = build_header_index(headers) if headers else None
 
             # Parse author entries
             author_entries = []
             for line in data_lines:
-                entry = parse_author_line(line, headers)
+                entry = parse_author_line(line, headers, header_index)
                 if entry:
                     author_entries.append(entry)
 
@@ -421,6 +459,8 @@ def main():
         sort_param = sort_map.get(args.sort)
     
     # Search for works
+    from .openalex_client import search_works, to_openalex_url, OpenAlexAPIError, RateLimitError
+
     print("Searching OpenAlex API...")
     try:
         works = search_works(
@@ -454,22 +494,17 @@ def main():
     # Collect searched author IDs for filtering
     searched_author_ids = []
     if args.author_id:
-        # Normalize the author ID
-        from .openalex_client import normalize_author_id
-        normalized_id = normalize_author_id(args.author_id)
-        if normalized_id.startswith("A") and normalized_id[1:].isdigit():
-            normalized_id = f"https://openalex.org/{normalized_id}"
-        searched_author_ids.append(normalized_id)
+        searched_author_ids.append(to_openalex_url(args.author_id))
     
     if author_ids_from_file:
         # These are already in URL format from lookup
         searched_author_ids.extend(author_ids_from_file)
     
-    # Format works
-    formatted_works = []
-    for work in works:
-        formatted = format_work(work, selected_fields, searched_author_ids if searched_author_ids else None)
-        formatted_works.append(formatted)
+    # Format works (field dispatch is resolved once, not per work)
+    from .formatter import make_work_formatter, write_json
+
+    format_one = make_work_formatter(selected_fields, searched_author_ids if searched_author_ids else None)
+    formatted_works = list(map(format_one, works))
     
     # Write to file
     try:
@@ -8,11 +8,15 @@ with the Tavily + OpenAlex pipeline.
 
 import csv
 import sys
-from typing import Dict, List, Optional
+from operator import itemgetter
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
 
 
 REQUIRED_COLUMNS = {"Last Name", "First Initial", "Department", "Job Title"}
 
+# Columns carried into parsed rows; everything else in the report is unused
+KEPT_COLUMNS = REQUIRED_COLUMNS | {"Unit Name"}
+
 # Map common column name variants to canonical names
 _HEADER_ALIASES = {
     "lastname": "Last Name",
@@ -30,33 +34,38 @@ _HEADER_ALIASES = {
 
 def _normalize_header(header: str) -> str:
     """Normalize a CSV header to its canonical name."""
-    return _HEADER_ALIASES.get(header.strip().lower(), header.strip())
+    stripped = header.strip()
+    return _HEADER_ALIASES.get(stripped.lower(), stripped)
 
 
-def parse_comp_report(file_path: str) -> List[Dict[str, str]]:
+def iter_comp_report(file_path: str) -> Iterator[Dict[str, str]]:
     """
-    Parse a CSU compensation report CSV file.
+    Lazily parse a CSU compensation report CSV file, one row at a time.
 
-    Uses csv.DictReader to handle quoted fields with commas (e.g.,
-    'Engineering,Walter Scott, Jr. (SCOE)').
+    Uses the csv module to handle quoted fields with commas (e.g.,
+    'Engineering,Walter Scott, Jr. (SCOE)'). Column positions are resolved
+    once from the header, and each row dict holds only the KEPT_COLUMNS.
+    Only the current row is held in memory, so large reports can be
+    filtered without loading every row first.
 
     Args:
         file_path: Path to the CSV file
 
-    Returns:
-        List of row dicts keyed by column header
+    Yields:
+        Row dicts keyed by canonical column name
 
     Raises:
         FileNotFoundError: If the file does not exist
         ValueError: If required columns are missing or file is empty
     """
-    with open(file_path, "r", encoding="utf-8-sig") as f:
-        reader = csv.DictReader(f)
-        if reader.fieldnames is None:
+    with open(file_path, "r", encoding="utf-8-sig", newline="") as f:
+        reader = csv.reader(f)
+        fieldnames = next(reader, None)
+        if fieldnames is None:
             raise ValueError(f"CSV file '{file_path}' is empty")
 
         # Normalize column headers to canonical names
-        canonical_names = [_normalize_header(h) for h in reader.fieldnames]
+        canonical_names = [_normalize_header(h) for h in fieldnames]
 
         missing = REQUIRED_COLUMNS - set(canonical_names)
         if missing:
@@ -64,18 +73,44 @@ def parse_comp_report(file_path: str) -> List[Dict[str, str]]:
                 f"CSV file missing required columns: {', '.join(sorted(missing))}"
             )
 
-        # Re-key each row using normalized headers
-        rows = []
-        for raw_row in reader:
-            row = {}
-            for orig_key, canon_key in zip(reader.fieldnames, canonical_names):
-                row[canon_key] = raw_row[orig_key]
-            rows.append(row)
+        # Resolve the positions of the columns we keep once, up front
+        kept = [(name, i) for i, name in enumerate(canonical_names) if name in KEPT_COLUMNS]
+        kept_names = [name for name, _ in kept]
+        kept_indexes = [i for _, i in kept]
+        get_kept = itemgetter(*kept_indexes)
+        min_length = max(kept_indexes) + 1
 
-    if not rows:
+        # Build each row from the kept positions, skipping blank lines
+        has_rows = False
+        for raw_row in reader:
+            if not raw_row:
+                continue
+            has_rows = True
+            if len(raw_row) >= min_length:
+                yield dict(zip(kept_names, get_kept(raw_row)))
+            else:
+                # Short row: keep whichever columns are present
+                yield {name: raw_row[i] for name, i in kept if i < len(raw_row)}
+
+    if not has_rows:
         raise ValueError(f"CSV file '{file_path}' contains no data rows")
 
-    return rows
+
+def parse_comp_report(file_path: str) -> List[Dict[str, str]]:
+    """
+    Parse a CSU compensation report CSV file.
+
+    Args:
+        file_path: Path to the CSV file
+
+    Returns:
+        List of row dicts keyed by canonical column name
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        ValueError: If required columns are missing or file is empty
+    """
+    return list(iter_comp_report(file_path))
 
 
 def get_unique_values(rows: List[Dict[str, str]], column: str) -> List[str]:
@@ -89,16 +124,31 @@ def get_unique_values(rows: List[Dict[str, str]], column: str) -> List[str]:
     Returns:
         Sorted list of unique non-empty string values
     """
-    values = set()
+    return get_unique_values_by_column(rows, (column,))[column]
+
+
+def get_unique_values_by_column(rows: List[Dict[str, str]], columns: Sequence[str]) -> Dict[str, List[str]]:
+    """
+    Return sorted unique non-empty values for several columns in one pass.
+
+    Args:
+        rows: List of row dicts from parse_comp_report
+        columns: Column names to extract unique values from
+
+    Returns:
+        Dictionary mapping each column to its sorted unique values
+    """
+    values = {column: set() for column in columns}
     for row in rows:
-        val = row.get(column, "").strip()
-        if val:
-            values.add(val)
-    return sorted(values)
+        for column, seen in values.items():
+            val = row.get(column, "").strip()
+            if val:
+                seen.add(val)
+    return {column: sorted(seen) for column, seen in values.items()}
 
 
 def filter_rows(
-    rows: List[Dict[str, str]],
+    rows: Iterable[Dict[str, str]],
     department: Optional[str] = None,
     job_title: Optional[str] = None,
 ) -> List[Dict[str, str]]:
@@ -109,21 +159,24 @@ def filter_rows(
     AND logic is applied (both must match).
 
     Args:
-        rows: List of row dicts
+        rows: Row dicts (any iterable, e.g. from iter_comp_report)
         department: Department substring filter, or None to skip
         job_title: Job title substring filter, or None to skip
 
     Returns:
         Filtered list of row dicts
     """
-    result = rows
-    if department:
-        dept_lower = department.lower()
-        result = [r for r in result if dept_lower in r.get("Department", "").lower()]
-    if job_title:
-        title_lower = job_title.lower()
-        result = [r for r in result if title_lower in r.get("Job Title", "").lower()]
-    return result
+    if not department and not job_title:
+        return list(rows)
+
+    # Lowercase the filters once and test both in a single pass over the rows
+    dept_lower = department.lower() if department else ""
+    title_lower = job_title.lower() if job_title else ""
+    return [
+        r for r in rows
+        if (not dept_lower or dept_lower in r.get("Department", "").lower())
+        and (not title_lower or title_lower in r.get("Job Title", "").lower())
+    ]
 
 
 def interactive_select(values: List[str], label: str) -> Optional[str]:
@@ -219,15 +272,16 @@ def load_and_filter_comp_report(
         FileNotFoundError: If the file does not exist
         ValueError: If the file is invalid or no authors remain after filtering
     """
-    rows = parse_comp_report(file_path)
-
     # Interactive selection when no flags provided
     if department is None and job_title is None:
-        departments = get_unique_values(rows, "Department")
-        department = interactive_select(departments, "Department")
-
-        job_titles = get_unique_values(rows, "Job Title")
-        job_title = interactive_select(job_titles, "Job Title")
+        rows = parse_comp_report(file_path)
+
+        unique_values = get_unique_values_by_column(rows, ("Department", "Job Title"))
+        department = interactive_select(unique_values["Department"], "Department")
+        job_title = interactive_select(unique_values["Job Title"], "Job Title")
+    else:
+        # Filters are known up front, so stream the file and keep only matches
+        rows = iter_comp_report(file_path)
 
     filtered = filter_rows(rows, department=department, job_title=job_title)
 
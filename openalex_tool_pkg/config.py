@@ -3,6 +3,8 @@ Configuration module for OpenAlex CLI tool.
 Defines available fields, field mappings, and default field sets.
 """
 
+from types import MappingProxyType
+
 # Core fields that are included by default
 CORE_FIELDS = [
     "id",
@@ -40,8 +42,8 @@ EXTENDED_FIELDS = [
 # All available fields
 ALL_FIELDS = CORE_FIELDS + EXTENDED_FIELDS
 
-# Field aliases for user-friendly names
-FIELD_ALIASES = {
+# Field aliases for user-friendly names (read-only)
+FIELD_ALIASES = MappingProxyType({
     "author": "authors",
     "date": "publication_date",
     "pub_date": "publication_date",
@@ -53,17 +55,56 @@ FIELD_ALIASES = {
     "venue": "sources",
     "open_access": "is_oa",
     "oa": "is_oa"
-}
+})
+
+# Every accepted spelling mapped to its canonical field, so resolution is a
+# single O(1) lookup. Aliases win over fields of the same name ("open_access").
+_RESOLVED_FIELDS = {field: field for field in ALL_FIELDS}
+_RESOLVED_FIELDS.update(FIELD_ALIASES)
 
-# Fields that need special handling in the formatter
-NESTED_FIELDS = {
+# Fields that need special handling in the formatter (read-only)
+NESTED_FIELDS = MappingProxyType({
     "authors": "authorships",
     "institutions": "authorships",
     "concepts": "concepts",
     "keywords": "keywords",
     "sources": "primary_location",
     "publisher": "primary_location"
-}
+})
+
+
+# OpenAlex work field each output field is read from, used to build the API's
+# select= parameter. None marks fields with no OpenAlex work field behind them;
+# nothing is selected for them and they come out null. Every entry in
+# ALL_FIELDS must appear here (read-only)
+SELECT_FIELDS = MappingProxyType({
+    "id": "id",
+    "title": "title",
+    "abstract": "abstract_inverted_index",
+    "authors": "authorships",
+    "publication_date": "publication_date",
+    "doi": "doi",
+    "type": "type",
+    "concepts": "concepts",
+    "keywords": "keywords",
+    "cited_by_count": "cited_by_count",
+    "institutions": "authorships",
+    "sources": "primary_location",
+    "publisher": "primary_location",
+    "language": "language",
+    "is_oa": None,
+    "open_access": "open_access",
+    "primary_location": "primary_location",
+    "locations": "locations",
+    "referenced_works": "referenced_works",
+    "related_works": "related_works",
+    "year": None,
+    "created_date": "created_date",
+    "updated_date": "updated_date",
+    "publication_year": "publication_year",
+    "cited_by_api_url": "cited_by_api_url",
+    "related_works_api_url": None,
+})
 
 
 def resolve_field_name(field_name: str) -> str:
@@ -76,17 +117,19 @@ def resolve_field_name(field_name: str) -> str:
     Returns:
         Resolved field name from ALL_FIELDS
     """
+    # Fast path: names that are already lowercase and trimmed
+    resolved = _RESOLVED_FIELDS.get(field_name)
+    if resolved is not None:
+        return resolved
+
     field_name = field_name.lower().strip()
     
-    # Check if it's an alias
-    if field_name in FIELD_ALIASES:
-        field_name = FIELD_ALIASES[field_name]
-    
-    # Validate it's a known field
-    if field_name not in ALL_FIELDS:
+    # Resolve aliases and validate it's a known field
+    resolved = _RESOLVED_FIELDS.get(field_name)
+    if resolved is None:
         raise ValueError(f"Unknown field: {field_name}")
     
-    return field_name
+    return resolved
 
 
 def get_default_fields() -> list:
@@ -130,7 +173,7 @@ def get_fields_to_select(include_fields: list = None, exclude_fields: list = Non
     
     if exclude_fields:
         # Remove excluded fields
-        exclude = validate_fields(exclude_fields)
+        exclude = frozenset(validate_fields(exclude_fields))
         fields = [f for f in fields if f not in exclude]
     
     return fields
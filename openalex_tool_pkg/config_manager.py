@@ -12,6 +12,9 @@ from typing import Optional
 CONFIG_DIR = Path.home() / ".openalex-tool"
 CONFIG_FILE = CONFIG_DIR / "config.json"
 
+# Last parsed config, keyed by (path, mtime, size) so edits to the file are seen
+_config_cache = {"key": None, "data": None}
+
 
 def get_config_dir() -> Path:
     """Get the configuration directory, creating it if needed."""
@@ -23,6 +26,9 @@ def load_config() -> dict:
     """
     Load configuration from file.
 
+    The parsed file is cached in-process and reused until the file's
+    modification time or size changes.
+
     Returns:
         Dictionary with configuration values
     """
@@ -30,22 +36,46 @@ def load_config() -> dict:
         return {}
 
     try:
+        stat = CONFIG_FILE.stat()
+        key = (CONFIG_FILE, stat.st_mtime_ns, stat.st_size)
+        if key == _config_cache["key"]:
+            return dict(_config_cache["data"])
+
         with open(CONFIG_FILE, "r", encoding="utf-8") as f:
-            return json.load(f)
+            data = json.load(f)
     except (json.JSONDecodeError, IOError):
         return {}
 
+    _config_cache["key"] = key
+    _config_cache["data"] = data
+    # Callers may modify the result before saving, so hand out a copy
+    return dict(data)
+
 
 def save_config(config: dict) -> None:
     """
     Save configuration to file.
 
+    Writes to a temporary file first and swaps it into place, so an
+    interrupted save never leaves a truncated config behind.
+
     Args:
         config: Dictionary with configuration values
     """
     get_config_dir()
-    with open(CONFIG_FILE, "w", encoding="utf-8") as f:
-        json.dump(config, f, indent=2)
+    tmp_file = CONFIG_FILE.with_suffix(".json.tmp")
+    try:
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(config, f, indent=2)
+        os.replace(tmp_file, CONFIG_FILE)
+    except BaseException:
+        try:
+            os.remove(tmp_file)
+        except OSError:
+            pass
+        raise
+    finally:
+        _config_cache["key"] = None
 
 
 def get_email() -> Optional[str]:
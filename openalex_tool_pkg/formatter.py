@@ -4,11 +4,17 @@ Handles transformation of OpenAlex work objects and JSON output writing.
 """
 
 import json
-from datetime import datetime
-from typing import List, Dict, Any, Optional
+from datetime import datetime, timezone
+from functools import partial
+from typing import Any, Callable, Collection, Dict, List, Optional, Tuple
 
+try:
+    import orjson
+except ImportError:  # optional speedup, stdlib json is used otherwise
+    orjson = None
 
-def extract_authors(authorships: List[Dict[str, Any]], searched_author_ids: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+
+def extract_authors(authorships: List[Dict[str, Any]], searched_author_ids: Optional[Collection[str]] = None) -> List[Dict[str, Any]]:
     """
     Extract and flatten author information from authorships.
     If searched_author_ids is provided, only returns authors that match.
@@ -16,46 +22,35 @@ def extract_authors(authorships: List[Dict[str, Any]], searched_author_ids: Opti
     
     Args:
         authorships: List of authorship objects from OpenAlex
-        searched_author_ids: Optional list of author IDs we're searching for
+        searched_author_ids: Optional author IDs we're searching for; pass a
+            set when formatting many works so membership checks stay O(1)
         
     Returns:
         List of simplified author dictionaries (max 1 author)
     """
-    authors = []
-    for authorship in authorships or []:
-        author = authorship.get("author", {})
-        if author:
-            author_id = author.get("id", "")
-            
-            # If we're searching for specific authors, only include matching ones
-            if searched_author_ids:
-                if author_id in searched_author_ids:
-                    author_info = {
-                        "id": author_id,
-                        "name": author.get("display_name", ""),
-                        "orcid": author.get("orcid", "")
-                    }
-                    # Add position if available
-                    if "author_position" in authorship:
-                        author_info["position"] = authorship["author_position"]
-                    authors.append(author_info)
-                    # Return immediately since we only want one author
-                    return authors
-            else:
-                # If not searching by author, return first author only
-                if not authors:  # Only add the first one
-                    author_info = {
-                        "id": author_id,
-                        "name": author.get("display_name", ""),
-                        "orcid": author.get("orcid", "")
-                    }
-                    # Add position if available
-                    if "author_position" in authorship:
-                        author_info["position"] = authorship["author_position"]
-                    authors.append(author_info)
-                    return authors
-    
-    return authors
+    for authorship in authorships or ():
+        author = authorship.get("author")
+        if not author:
+            continue
+
+        author_id = author.get("id", "")
+        # If we're searching for specific authors, only include matching ones;
+        # otherwise the first author is the one we want
+        if searched_author_ids and author_id not in searched_author_ids:
+            continue
+
+        author_info = {
+            "id": author_id,
+            "name": author.get("display_name", ""),
+            "orcid": author.get("orcid", "")
+        }
+        # Add position if available
+        if "author_position" in authorship:
+            author_info["position"] = authorship["author_position"]
+        # Return immediately since we only want one author
+        return [author_info]
+
+    return []
 
 
 def extract_institutions(authorships: List[Dict[str, Any]]) -> List[str]:
@@ -68,17 +63,13 @@ def extract_institutions(authorships: List[Dict[str, Any]]) -> List[str]:
     Returns:
         List of institution display names
     """
-    institutions = []
-    seen = set()
-    
-    for authorship in authorships or []:
-        for institution in authorship.get("institutions", []):
-            inst_name = institution.get("display_name", "")
-            if inst_name and inst_name not in seen:
-                institutions.append(inst_name)
-                seen.add(inst_name)
-    
-    return institutions
+    # Dicts keep insertion order, so one structure both dedups and orders
+    return list(dict.fromkeys(
+        inst_name
+        for authorship in authorships or ()
+        for institution in authorship.get("institutions", ())
+        if (inst_name := institution.get("display_name"))
+    ))
 
 
 def extract_concepts(concepts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -91,15 +82,14 @@ def extract_concepts(concepts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     Returns:
         List of simplified concept dictionaries
     """
-    result = []
-    for concept in concepts or []:
-        concept_info = {
+    return [
+        {
             "id": concept.get("id", ""),
             "name": concept.get("display_name", ""),
             "score": concept.get("score", 0.0)
         }
-        result.append(concept_info)
-    return result
+        for concept in concepts or ()
+    ]
 
 
 def extract_keywords(keywords: List[Dict[str, Any]]) -> List[str]:
@@ -112,7 +102,7 @@ def extract_keywords(keywords: List[Dict[str, Any]]) -> List[str]:
     Returns:
         List of keyword strings
     """
-    return [kw.get("display_name", "") for kw in (keywords or []) if kw.get("display_name")]
+    return [name for kw in (keywords or ()) if (name := kw.get("display_name"))]
 
 
 def extract_source(primary_location: Dict[str, Any]) -> Optional[Dict[str, Any]]:
@@ -128,7 +118,7 @@ def extract_source(primary_location: Dict[str, Any]) -> Optional[Dict[str, Any]]
     if not primary_location:
         return None
     
-    source = primary_location.get("source", {})
+    source = primary_location.get("source")
     if not source:
         return None
     
@@ -156,70 +146,171 @@ def reconstruct_abstract_from_inverted_index(inverted_index: Dict[str, List[int]
     if not inverted_index:
         return ""
     
-    # Create list of (word, position) tuples
-    word_positions = []
+    # Place each word directly at its position instead of sorting
+    last_position = max((p for positions in inverted_index.values() for p in positions), default=-1)
+    words = [None] * (last_position + 1)
     for word, positions in inverted_index.items():
         for position in positions:
-            word_positions.append((position, word))
-    
-    # Sort by position
-    word_positions.sort(key=lambda x: x[0])
-    
-    # Join words with spaces
-    abstract = " ".join(word for _, word in word_positions)
+            words[position] = word
     
+    # Join words with spaces, skipping any gaps in the positions
+    return " ".join(word for word in words if word is not None)
+
+
+# Plan type: ordered (output_key, extractor) pairs applied to every work
+FormatPlan = List[Tuple[str, Callable[[Dict[str, Any]], Any]]]
+
+# Returned by an extractor when its output key should be left out entirely
+_OMIT = object()
+
+
+def _extract_abstract(work: Dict[str, Any]) -> str:
+    # Abstract might be in abstract_inverted_index or just abstract
+    abstract = work.get("abstract", "")
+    if not abstract and "abstract_inverted_index" in work:
+        # Reconstruct abstract from inverted index
+        inverted_index = work.get("abstract_inverted_index")
+        if inverted_index:
+            abstract = reconstruct_abstract_from_inverted_index(inverted_index)
     return abstract
 
 
-def format_work(work: Dict[str, Any], selected_fields: List[str], searched_author_ids: Optional[List[str]] = None) -> Dict[str, Any]:
+# Fields whose extraction does not depend on the rest of the selection
+_FIELD_EXTRACTORS = {
+    "institutions": lambda work: extract_institutions(work.get("authorships", ())),
+    "concepts": lambda work: extract_concepts(work.get("concepts", ())),
+    "keywords": lambda work: extract_keywords(work.get("keywords", ())),
+    "abstract": _extract_abstract,
+}
+
+
+def _make_source_getter(shared: bool) -> Callable[[Dict[str, Any]], Optional[Dict[str, Any]]]:
     """
-    Transform OpenAlex work object to simplified structure.
-    
+    Build the source extractor used by the "sources" and "publisher" fields.
+
+    When both fields are selected, the getter remembers the last work it saw
+    so the source is only extracted once per work.
+    """
+    if not shared:
+        return lambda work: extract_source(work.get("primary_location"))
+
+    last = [None, None]  # [work, extracted source]
+
+    def get_source(work: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        if last[0] is not work:
+            last[0] = work
+            last[1] = extract_source(work.get("primary_location"))
+        return last[1]
+
+    return get_source
+
+
+def build_format_plan(selected_fields: List[str], searched_author_ids: Optional[List[str]] = None) -> FormatPlan:
+    """
+    Resolve the selected fields into an ordered list of extractors.
+
+    Building the plan once and applying it to every work avoids repeating
+    the per-field dispatch for each work in the result set.
+
     Args:
-        work: Raw work object from OpenAlex API
         selected_fields: List of fields to include in output
         searched_author_ids: Optional list of author IDs we're searching for
-        
+
     Returns:
-        Simplified work dictionary
+        List of (output_key, extractor) tuples
     """
-    formatted = {}
-    
-    # Handle each selected field
+    selected = frozenset(selected_fields)
+    # Convert once so each authorship check is a set lookup, not a list scan
+    author_ids = frozenset(searched_author_ids) if searched_author_ids else None
+    get_source = _make_source_getter("sources" in selected and "publisher" in selected)
+
+    def get_publisher(work: Dict[str, Any]) -> Any:
+        source = get_source(work)
+        return source.get("name", "") if source else _OMIT
+
+    plan = []
     for field in selected_fields:
         if field == "authors":
-            formatted["authors"] = extract_authors(work.get("authorships", []), searched_author_ids)
-        elif field == "institutions":
-            formatted["institutions"] = extract_institutions(work.get("authorships", []))
-        elif field == "concepts":
-            formatted["concepts"] = extract_concepts(work.get("concepts", []))
-        elif field == "keywords":
-            formatted["keywords"] = extract_keywords(work.get("keywords", []))
+            plan.append(("authors", lambda work: extract_authors(work.get("authorships", ()), author_ids)))
         elif field == "sources":
-            formatted["source"] = extract_source(work.get("primary_location", {}))
+            plan.append(("source", get_source))
         elif field == "publisher":
-            source = extract_source(work.get("primary_location", {}))
-            if source:
-                formatted["publisher"] = source.get("name", "")
-        elif field == "abstract":
-            # Abstract might be in abstract_inverted_index or just abstract
-            abstract = work.get("abstract", "")
-            if not abstract and "abstract_inverted_index" in work:
-                # Reconstruct abstract from inverted index
-                inverted_index = work.get("abstract_inverted_index", {})
-                if inverted_index:
-                    abstract = reconstruct_abstract_from_inverted_index(inverted_index)
-            formatted["abstract"] = abstract
-        elif field in work:
-            # Direct field mapping
-            formatted[field] = work[field]
+            plan.append(("publisher", get_publisher))
+        elif field in _FIELD_EXTRACTORS:
+            plan.append((field, _FIELD_EXTRACTORS[field]))
         else:
-            # Field not found, set to None
-            formatted[field] = None
-    
+            # Direct field mapping; None if the field is missing
+            plan.append((field, lambda work, field=field: work.get(field)))
+    return plan
+
+
+def apply_format_plan(work: Dict[str, Any], plan: FormatPlan) -> Dict[str, Any]:
+    """
+    Transform an OpenAlex work object using a prebuilt format plan.
+
+    Args:
+        work: Raw work object from OpenAlex API
+        plan: Plan returned by build_format_plan()
+
+    Returns:
+        Simplified work dictionary
+    """
+    formatted = {}
+    for key, extract in plan:
+        value = extract(work)
+        if value is not _OMIT:
+            formatted[key] = value
     return formatted
 
 
+def make_work_formatter(selected_fields: List[str], searched_author_ids: Optional[List[str]] = None) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Build a single-argument formatter for a fixed field selection.
+
+    Args:
+        selected_fields: List of fields to include in output
+        searched_author_ids: Optional list of author IDs we're searching for
+
+    Returns:
+        Callable mapping a raw work object to its simplified dictionary
+    """
+    return partial(apply_format_plan, plan=build_format_plan(selected_fields, searched_author_ids))
+
+
+def format_work(work: Dict[str, Any], selected_fields: List[str], searched_author_ids: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    Transform OpenAlex work object to simplified structure.
+
+    For many works, build a formatter once with make_work_formatter() and
+    map it over the works instead.
+    
+    Args:
+        work: Raw work object from OpenAlex API
+        selected_fields: List of fields to include in output
+        searched_author_ids: Optional list of author IDs we're searching for
+        
+    Returns:
+        Simplified work dictionary
+    """
+    return apply_format_plan(work, build_format_plan(selected_fields, searched_author_ids))
+
+
+# Output file buffer size; works are written one call each, so a larger
+# buffer means fewer write syscalls on big result sets
+_WRITE_BUFFER_SIZE = 1 << 20
+
+
+def _dumps_indented(obj: Any) -> str:
+    """Serialize obj as 2-space indented JSON, using orjson when installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except orjson.JSONEncodeError:
+            # e.g. an integer wider than 64 bits; the stdlib can still encode it
+            pass
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
 def write_json(
     works: List[Dict[str, Any]],
     output_path: str,
@@ -227,23 +318,36 @@ def write_json(
 ) -> None:
     """
     Write works to JSON file with metadata.
+
+    Each work is serialized and written on its own rather than encoding the
+    whole document at once, so only one work's JSON text is held in memory
+    at a time. Without orjson the output matches
+    json.dump(..., indent=2, ensure_ascii=False). With orjson it is the same
+    JSON except that NaN and Infinity are written as null and floats may be
+    formatted differently (e.g. 1e16 rather than 1e+16); a work orjson cannot
+    encode, such as one holding an integer wider than 64 bits, is serialized
+    with the stdlib instead.
     
     Args:
         works: List of formatted work objects
         output_path: Path to output JSON file
         query_info: Dictionary with query information (search terms, filters, etc.)
     """
-    output = {
-        "works": works,
-        "metadata": {
-            "total": len(works),
-            "timestamp": datetime.utcnow().isoformat() + "Z",
-            "query": query_info or {}
-        }
+    metadata = {
+        "total": len(works),
+        "timestamp": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "query": query_info or {}
     }
     
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(output, f, indent=2, ensure_ascii=False)
+    with open(output_path, "w", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE) as f:
+        f.write('{\n  "works": [')
+        for i, work in enumerate(works):
+            f.write(",\n    " if i else "\n    ")
+            # Re-indent to the nesting level inside the "works" array
+            f.write(_dumps_indented(work).replace("\n", "\n    "))
+        f.write("\n  ]" if works else "]")
+        f.write(',\n  "metadata": ')
+        f.write(_dumps_indented(metadata).replace("\n", "\n  "))
+        f.write("\n}")
     
     print(f"✓ Saved {len(works)} works to {output_path}")
-
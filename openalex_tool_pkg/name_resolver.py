@@ -9,9 +9,18 @@ import os
 import re
 import sys
 import warnings
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 
 
+# One or more single-letter initials (optionally followed by periods), then a
+# final name part, e.g. "E. Kelly" or "J R Smith"
+_ABBREVIATED_NAME_RE = re.compile(r"(?:[^\W\d_]\.*\s+)+\S+")
+
+# Lowercased header names that mark an author file as TSV with headers
+_LAST_NAME_HEADERS = frozenset({"lastname", "last_name"})
+
+
 def is_abbreviated_name(name: str) -> bool:
     """
     Detect if a name contains only first initials (no full first name).
@@ -22,19 +31,10 @@ def is_abbreviated_name(name: str) -> bool:
     Returns:
         True if all parts except the last are single characters (with optional period)
     """
-    if not name or not name.strip():
-        return False
-
-    parts = name.strip().split()
-    if len(parts) < 2:
+    if not name:
         return False
 
-    # Check if all parts except the last are single-character initials
-    first_parts = parts[:-1]
-    return all(
-        len(p.rstrip(".")) == 1 and p.rstrip(".").isalpha()
-        for p in first_parts
-    )
+    return _ABBREVIATED_NAME_RE.fullmatch(name.strip()) is not None
 
 
 def detect_file_format(first_line: str) -> Optional[List[str]]:
@@ -52,20 +52,40 @@ def detect_file_format(first_line: str) -> Optional[List[str]]:
 
     columns = [col.strip() for col in first_line.split("\t")]
     # Check for expected header names (case-insensitive)
-    lower_columns = [c.lower() for c in columns]
-    if "lastname" in lower_columns or "last_name" in lower_columns:
+    if not _LAST_NAME_HEADERS.isdisjoint(c.lower() for c in columns):
         return columns
 
     return None
 
 
-def parse_author_line(line: str, headers: Optional[List[str]] = None) -> Optional[Dict[str, str]]:
+def build_header_index(headers: List[str]) -> Dict[str, int]:
+    """
+    Map lowercased TSV header names to their column positions.
+
+    Args:
+        headers: Column headers from detect_file_format()
+
+    Returns:
+        Dictionary of lowercased header name to column index
+    """
+    return {header.strip().lower(): i for i, header in enumerate(headers)}
+
+
+def parse_author_line(
+    line: str,
+    headers: Optional[List[str]] = None,
+    header_index: Optional[Dict[str, int]] = None,
+) -> Optional[Dict[str, str]]:
     """
     Parse a single line from an author file.
 
+    When parsing many lines, build the header index once with
+    build_header_index() and pass it in to avoid rebuilding it per line.
+
     Args:
         line: A single line from the author file
         headers: Column headers if TSV format, None for plain text
+        header_index: Precomputed result of build_header_index(headers)
 
     Returns:
         Dictionary with author info, or None if line is empty/invalid
@@ -74,20 +94,17 @@ def parse_author_line(line: str, headers: Optional[List[str]] = None) -> Optiona
     if not line:
         return None
 
-    if headers is None:
+    if headers is None and header_index is None:
         # Plain text mode: line is the full name
         return {"name": line}
 
     # TSV mode: split by tabs and map to headers
     values = line.split("\t")
-    row = {}
-    header_lower_map = {}
-    for i, header in enumerate(headers):
-        lower = header.strip().lower()
-        header_lower_map[lower] = i
+    if header_index is None:
+        header_index = build_header_index(headers)
 
     def get_val(key):
-        idx = header_lower_map.get(key)
+        idx = header_index.get(key)
         if idx is not None and idx < len(values):
             return values[idx].strip()
         return ""
@@ -142,6 +159,21 @@ def get_tavily_api_key(cli_key: Optional[str] = None) -> Optional[str]:
         return None
 
 
+@lru_cache(maxsize=8)
+def _get_tavily_client(api_key: str):
+    """Return a TavilyClient for api_key, built once and shared by later searches."""
+    from tavily import TavilyClient
+    return TavilyClient(api_key=api_key)
+
+
+@lru_cache(maxsize=4096)
+def _full_name_pattern(last_name: str) -> "re.Pattern":
+    """Compile (once per last name) the regex for "FirstName [MiddleInitial] LastName"."""
+    return re.compile(
+        r'\b([A-Z][a-z]+(?:\s+[A-Z]\.?\s*)?)\s+' + re.escape(last_name) + r'\b'
+    )
+
+
 def extract_full_name_from_results(tavily_response: dict, last_name: str, institution: Optional[str] = None) -> Optional[str]:
     """
     Extract a full author name from Tavily search results.
@@ -158,9 +190,7 @@ def extract_full_name_from_results(tavily_response: dict, last_name: str, instit
         Full name string if found, None otherwise
     """
     # Regex to find "FirstName [MiddleInitial] LastName"
-    pattern = re.compile(
-        r'\b([A-Z][a-z]+(?:\s+[A-Z]\.?\s*)?)\s+' + re.escape(last_name) + r'\b'
-    )
+    pattern = _full_name_pattern(last_name)
 
     # 1. Check the answer field first (most reliable)
     answer = tavily_response.get("answer", "") or ""
@@ -267,7 +297,7 @@ def resolve_abbreviated_name(
         inst_domain = "colostate.edu"
 
     try:
-        client = TavilyClient(api_key=tavily_api_key)
+        client = _get_tavily_client(tavily_api_key)
 
         # Try with domain filter first, fall back to unrestricted
         if inst_domain:
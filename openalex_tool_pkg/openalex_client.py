@@ -3,12 +3,29 @@ OpenAlex API client module.
 Handles API interactions, query building, and pagination.
 """
 
+import math
+import random
+import re
 import time
 import sys
+import threading
 import requests
-from typing import List, Dict, Optional, Any
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
+from typing import List, Dict, Optional, Any, Tuple
 from urllib.parse import urlencode
 
+from .config import SELECT_FIELDS
+
+try:
+    import orjson
+except ImportError:  # optional speedup, response.json() is used otherwise
+    orjson = None
+
 
 BASE_URL = "https://api.openalex.org/works"
 INSTITUTIONS_URL = "https://api.openalex.org/institutions"
@@ -16,9 +33,35 @@ AUTHORS_URL = "https://api.openalex.org/authors"
 DEFAULT_PER_PAGE = 25
 MAX_PER_PAGE = 200
 DEFAULT_MAX_RESULTS = 100
+MAX_NAMES_PER_LOOKUP = 25
+# OpenAlex supports up to 100 author IDs per filter with OR logic, but URL length
+# limits mean we need smaller batches (about 25-50 IDs per request)
+MAX_AUTHORS_PER_FILTER = 25
+MAX_PAGE_WORKERS = 4
+MAX_BATCH_WORKERS = 4
+# OpenAlex's polite pool allows about 10 requests per second
+MIN_REQUEST_INTERVAL = 0.1
+# Ceiling on how far the request interval backs off after rate limiting
+MAX_REQUEST_BACKOFF = 50
+# Wait used when a 429 has no usable Retry-After, and the most we'll honor
+MAX_RETRY_AFTER = 60
+# OpenAlex only serves the first 10,000 results of a query by page number;
+# deeper walks need cursor pagination
+MAX_PAGED_RESULTS = 10000
+
+# A bare ORCID: 16 characters (the last may be the X checksum), dashes anywhere
+_BARE_ORCID_RE = re.compile(r"-*(?:\d-*){15}[\dX]-*")
 
-# Cache for CSU institution ID
-_CSU_ID_CACHE = None
+# Shared session so repeated API calls reuse pooled HTTPS connections
+# instead of opening a new TCP/TLS connection per request
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_maxsize=MAX_BATCH_WORKERS * MAX_PAGE_WORKERS))
+
+# Earliest time the next throttled request may start, shared across threads
+_next_request_time = 0.0
+# Multiplier on MIN_REQUEST_INTERVAL; grows on 429s and decays on success
+_request_backoff = 1.0
+_request_time_lock = threading.Lock()
 
 
 class OpenAlexAPIError(Exception):
@@ -31,9 +74,35 @@ class RateLimitError(OpenAlexAPIError):
     pass
 
 
+def _polite_params(params: Dict[str, Any], email: Optional[str]) -> Dict[str, Any]:
+    """Add the polite pool mailto parameter to params when an email is set."""
+    if email:
+        params["mailto"] = email
+    return params
+
+
+@lru_cache(maxsize=256)
+def _lookup_institution_id_cached(institution_name: str, email: Optional[str]) -> Optional[str]:
+    """Fetch an institution ID; failed requests raise, so they are not cached."""
+    params = _polite_params({
+        "filter": f"display_name.search:{institution_name}",
+        "per_page": 1
+    }, email)
+
+    response = make_request(INSTITUTIONS_URL, params)
+    results = response.get("results", [])
+    if results:
+        return results[0].get("id")
+    return None
+
+
 def lookup_institution_id(institution_name: str, email: Optional[str] = None) -> Optional[str]:
     """
     Look up institution ID by name.
+
+    Successful lookups are cached for the life of the process, so repeated
+    queries for the same institution (e.g. one per page or author batch)
+    only hit the API once.
     
     Args:
         institution_name: Institution display name
@@ -42,28 +111,17 @@ def lookup_institution_id(institution_name: str, email: Optional[str] = None) ->
     Returns:
         Institution OpenAlex ID URL or None if not found
     """
-    params = {
-        "filter": f"display_name.search:{institution_name}",
-        "per_page": 1
-    }
-    if email:
-        params["mailto"] = email
-    
     try:
-        response = make_request(INSTITUTIONS_URL, params)
-        results = response.get("results", [])
-        if results:
-            return results[0].get("id")
+        return _lookup_institution_id_cached(institution_name, email)
     except Exception:
-        pass
-    
-    return None
+        return None
 
 
 def lookup_csu_id(email: Optional[str] = None) -> Optional[str]:
     """
     Look up Colorado State University's institution ID.
-    Uses caching to avoid repeated lookups.
+    The result is cached per (institution name, email) by
+    _lookup_institution_id_cached, so repeated calls hit the API once.
     
     Args:
         email: Email for polite pool
@@ -71,14 +129,7 @@ def lookup_csu_id(email: Optional[str] = None) -> Optional[str]:
     Returns:
         CSU institution ID URL or None if not found
     """
-    global _CSU_ID_CACHE
-    
-    if _CSU_ID_CACHE is not None:
-        return _CSU_ID_CACHE
-    
-    csu_id = lookup_institution_id("Colorado State University", email)
-    _CSU_ID_CACHE = csu_id
-    return csu_id
+    return lookup_institution_id("Colorado State University", email)
 
 
 def get_csu_author_ids(email: Optional[str] = None, max_authors: int = 1000) -> List[str]:
@@ -101,16 +152,15 @@ def get_csu_author_ids(email: Optional[str] = None, max_authors: int = 1000) ->
     per_page = 200  # Max per page for authors endpoint
     
     while len(author_ids) < max_authors:
-        params = {
+        params = _polite_params({
             "filter": f"last_known_institutions.id:{csu_id}",
             "per_page": per_page,
             "page": page,
             "select": "id"  # Only get IDs to save bandwidth
-        }
-        if email:
-            params["mailto"] = email
+        }, email)
         
         try:
+            _wait_for_request_slot()  # Be polite
             response = make_request(AUTHORS_URL, params)
             results = response.get("results", [])
             if not results:
@@ -128,7 +178,6 @@ def get_csu_author_ids(email: Optional[str] = None, max_authors: int = 1000) ->
                 break
             
             page += 1
-            time.sleep(0.1)  # Be polite
             
         except Exception as e:
             print(f"Warning: Error fetching CSU authors: {e}", file=sys.stderr)
@@ -137,6 +186,53 @@ def get_csu_author_ids(email: Optional[str] = None, max_authors: int = 1000) ->
     return author_ids[:max_authors]
 
 
+def filter_csu_author_ids(author_ids: List[str], email: Optional[str] = None) -> List[str]:
+    """
+    Keep only the author IDs whose last known institution is Colorado State University.
+
+    Asks the authors endpoint about the given IDs directly, in batches of
+    MAX_AUTHORS_PER_FILTER, instead of downloading every CSU author and
+    intersecting.
+
+    Args:
+        author_ids: OpenAlex author IDs (short form or full URLs)
+        email: Email for polite pool
+
+    Returns:
+        The given author IDs that belong to CSU, in their original order
+
+    Raises:
+        OpenAlexAPIError: For API errors
+    """
+    csu_id = lookup_csu_id(email)
+    if not csu_id:
+        return []
+
+    # Only OpenAlex IDs can match; ORCIDs and other identifiers are dropped
+    short_ids = {aid: aid.rsplit("/", 1)[-1] for aid in author_ids}
+    candidates = list(dict.fromkeys(
+        short_id for short_id in short_ids.values()
+        if short_id.startswith("A") and short_id[1:].isdigit()
+    ))
+
+    csu_short_ids = set()
+    for i in range(0, len(candidates), MAX_AUTHORS_PER_FILTER):
+        batch = candidates[i:i + MAX_AUTHORS_PER_FILTER]
+        params = _polite_params({
+            "filter": f"openalex:{'|'.join(batch)},last_known_institutions.id:{csu_id}",
+            "per_page": MAX_PER_PAGE,
+            "select": "id"
+        }, email)
+
+        _wait_for_request_slot()
+        response = make_request(AUTHORS_URL, params)
+        for author in response.get("results", []):
+            if author.get("id"):
+                csu_short_ids.add(author["id"].rsplit("/", 1)[-1])
+
+    return [aid for aid in author_ids if short_ids[aid] in csu_short_ids]
+
+
 def lookup_author_id(author_name: str, email: Optional[str] = None, institution_id: Optional[str] = None) -> Optional[str]:
     """
     Look up author ID by name, optionally filtered by institution.
@@ -155,12 +251,10 @@ def lookup_author_id(author_name: str, email: Optional[str] = None, institution_
     filter_parts = [f"display_name.search:{author_name}"]
     if institution_id:
         filter_parts.append(f"last_known_institutions.id:{institution_id}")
-    params = {
+    params = _polite_params({
         "filter": ",".join(filter_parts),
         "per_page": 1
-    }
-    if email:
-        params["mailto"] = email
+    }, email)
 
     try:
         response = make_request(AUTHORS_URL, params)
@@ -181,6 +275,101 @@ def lookup_author_id(author_name: str, email: Optional[str] = None, institution_
     return None
 
 
+def _normalize_author_name(name: str) -> Tuple[str, ...]:
+    """Split a name into lowercase parts, treating periods as separators."""
+    return tuple(name.lower().replace(".", " ").split())
+
+
+def _author_name_matches(requested: Tuple[str, ...], candidate: Tuple[str, ...]) -> bool:
+    """
+    Check whether a result name could be the requested author.
+
+    Abbreviated requests ("E. Kelly", "J R Smith") match on first initial and
+    last name; requests with a full first name must match the whole name.
+    """
+    if len(candidate) < 2:
+        return False
+    if all(len(part) == 1 for part in requested[:-1]):
+        return requested[0] == candidate[0][0] and requested[-1] == candidate[-1]
+    return requested == candidate
+
+
+def lookup_author_ids_batch(
+    author_names: List[str],
+    email: Optional[str] = None,
+    institution_id: Optional[str] = None
+) -> Dict[str, Optional[str]]:
+    """
+    Look up author IDs for many names using as few requests as possible.
+
+    Names are OR-ed into a single display_name.search filter, up to
+    MAX_NAMES_PER_LOOKUP per request, and the results are matched back to
+    the names: full names must match exactly (ignoring case and periods),
+    abbreviated names by first initial and last name. A name is only taken
+    from a batch when exactly one author matches it; names with no match or
+    several possible matches fall back to lookup_author_id().
+
+    Args:
+        author_names: Author display names
+        email: Email for polite pool
+        institution_id: Optional institution ID to narrow results
+
+    Returns:
+        Dictionary mapping each name to its author ID URL, or None if not found
+    """
+    found = {}
+
+    # Names containing filter syntax or without a first name can't be
+    # batched or matched reliably, so they go straight to the fallback
+    batchable = [
+        name for name in dict.fromkeys(author_names)
+        if "," not in name and "|" not in name and len(_normalize_author_name(name)) >= 2
+    ]
+
+    for i in range(0, len(batchable), MAX_NAMES_PER_LOOKUP):
+        batch = batchable[i:i + MAX_NAMES_PER_LOOKUP]
+        filter_parts = ["display_name.search:" + "|".join(batch)]
+        if institution_id:
+            filter_parts.append(f"last_known_institutions.id:{institution_id}")
+        params = _polite_params({
+            "filter": ",".join(filter_parts),
+            "per_page": MAX_PER_PAGE
+        }, email)
+
+        try:
+            response = make_request(AUTHORS_URL, params)
+        except OpenAlexAPIError:
+            continue
+
+        # Index requested names by last name, then collect every result
+        # author each one could refer to
+        by_last_name = {}
+        for name in batch:
+            parts = _normalize_author_name(name)
+            by_last_name.setdefault(parts[-1], []).append((name, parts))
+        matches = {name: set() for name in batch}
+        for author in response.get("results", []):
+            author_id = author.get("id")
+            candidate = _normalize_author_name(author.get("display_name") or "")
+            if not author_id or not candidate:
+                continue
+            for name, parts in by_last_name.get(candidate[-1], ()):
+                if _author_name_matches(parts, candidate):
+                    matches[name].add(author_id)
+
+        # Relevance order in an OR-ed search isn't per-name order, so only
+        # an unambiguous match is trusted
+        for name, author_ids in matches.items():
+            if len(author_ids) == 1:
+                found[name] = next(iter(author_ids))
+
+    for name in author_names:
+        if name not in found:
+            found[name] = lookup_author_id(name, email, institution_id)
+
+    return found
+
+
 def normalize_author_id(author_id: str) -> str:
     """
     Normalize author ID to OpenAlex format.
@@ -196,24 +385,59 @@ def normalize_author_id(author_id: str) -> str:
         Normalized OpenAlex ID or ORCID URL
     """
     author_id = author_id.strip()
-    
-    # If it's already an OpenAlex ID (starts with A)
-    if author_id.startswith("A") and author_id[1:].isdigit():
-        return author_id
-    
-    # If it's an ORCID (with or without URL)
+
+    # If it's an ORCID URL, extract the ORCID from it
     if "orcid.org" in author_id:
-        # Extract ORCID from URL
         orcid = author_id.split("/")[-1]
         return f"https://orcid.org/{orcid}"
-    elif author_id.replace("-", "").isdigit() and len(author_id.replace("-", "")) == 16:
-        # Looks like an ORCID without URL
+
+    # Looks like an ORCID without URL
+    if _BARE_ORCID_RE.fullmatch(author_id):
         return f"https://orcid.org/{author_id}"
-    
-    # Assume it's an OpenAlex ID
+
+    # OpenAlex IDs (A1234567890) and anything else pass through unchanged
     return author_id
 
 
+def to_openalex_url(author_id: str) -> str:
+    """
+    Normalize an author ID, expanding bare OpenAlex IDs to full URLs.
+
+    Args:
+        author_id: Author identifier in any format normalize_author_id accepts
+
+    Returns:
+        https://openalex.org/A... for OpenAlex IDs, otherwise the normalized ID
+    """
+    normalized_id = normalize_author_id(author_id)
+    if normalized_id.startswith("A") and normalized_id[1:].isdigit():
+        return f"https://openalex.org/{normalized_id}"
+    return normalized_id
+
+
+def build_select_param(fields: List[str]) -> str:
+    """
+    Build the select parameter for the work fields behind the output fields.
+
+    The work field behind each output field comes from config.SELECT_FIELDS.
+    Output fields without one (e.g. "is_oa") select nothing and come out
+    empty, as they would from a full work.
+    "id" is always selected since batched results are deduplicated by it.
+
+    Args:
+        fields: Output fields selected for formatting
+
+    Returns:
+        Comma-separated OpenAlex work fields
+    """
+    selected = {"id"}
+    for field in fields:
+        work_field = SELECT_FIELDS.get(field)
+        if work_field:
+            selected.add(work_field)
+    return ",".join(sorted(selected))
+
+
 def build_query_params(
     search: Optional[str] = None,
     author_id: Optional[str] = None,
@@ -224,7 +448,8 @@ def build_query_params(
     sort: Optional[str] = None,
     per_page: int = DEFAULT_PER_PAGE,
     page: int = 1,
-    email: Optional[str] = None
+    email: Optional[str] = None,
+    cursor: Optional[str] = None
 ) -> Dict[str, Any]:
     """
     Build query parameters for OpenAlex API request.
@@ -237,15 +462,13 @@ def build_query_params(
         per_page: Number of results per page
         page: Page number
         email: Email for polite pool
+        cursor: Cursor for cursor pagination ("*" to start); replaces page
         
     Returns:
         Dictionary of query parameters
     """
-    params = {}
-    
     # Add email for polite pool
-    if email:
-        params["mailto"] = email
+    params = _polite_params({}, email)
     
     # Text search
     if search:
@@ -255,21 +478,8 @@ def build_query_params(
     filters = []
     
     # Handle author IDs (single or multiple)
-    author_id_list = []
-    if author_id:
-        normalized_id = normalize_author_id(author_id)
-        # Convert OpenAlex ID to full URL format if needed
-        if normalized_id.startswith("A") and normalized_id[1:].isdigit():
-            normalized_id = f"https://openalex.org/{normalized_id}"
-        author_id_list.append(normalized_id)
-    
-    if author_ids:
-        # Normalize all author IDs
-        for aid in author_ids:
-            normalized_id = normalize_author_id(aid)
-            if normalized_id.startswith("A") and normalized_id[1:].isdigit():
-                normalized_id = f"https://openalex.org/{normalized_id}"
-            author_id_list.append(normalized_id)
+    raw_ids = ([author_id] if author_id else []) + list(author_ids or [])
+    author_id_list = [to_openalex_url(aid) for aid in raw_ids]
     
     # Combine multiple author IDs with OR logic
     if author_id_list:
@@ -295,9 +505,9 @@ def build_query_params(
     if filters:
         params["filter"] = ",".join(filters)
     
-    # Note: OpenAlex API doesn't support selecting nested fields like "authors"
-    # We fetch all fields and filter in the formatter instead
-    # Field selection is handled in formatter.py, not in API query
+    # Only fetch the work fields the formatter needs for the selected output
+    if fields:
+        params["select"] = build_select_param(fields)
     
     # Sorting
     if sort:
@@ -305,11 +515,49 @@ def build_query_params(
     
     # Pagination
     params["per_page"] = min(per_page, MAX_PER_PAGE)
-    params["page"] = page
+    if cursor:
+        params["cursor"] = cursor
+    else:
+        params["page"] = page
     
     return params
 
 
+def _decode_json(response: requests.Response) -> Dict[str, Any]:
+    """Decode a JSON response body, with orjson when installed."""
+    if orjson is not None:
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            pass  # let requests decode it and raise its usual error
+    return response.json()
+
+
+def _parse_retry_after(value: Optional[str]) -> float:
+    """
+    Parse a Retry-After header into seconds to wait.
+
+    The header may be delta-seconds or an HTTP date. Missing or unparsable
+    values (including "nan" and "inf"), and waits longer than MAX_RETRY_AFTER,
+    give MAX_RETRY_AFTER.
+    """
+    if not value:
+        return MAX_RETRY_AFTER
+    try:
+        seconds = float(value)
+        if not math.isfinite(seconds):
+            return MAX_RETRY_AFTER
+    except ValueError:
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return MAX_RETRY_AFTER
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        seconds = (retry_at - datetime.now(timezone.utc)).total_seconds()
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER)
+
+
 def make_request(url: str, params: Dict[str, Any], max_retries: int = 3) -> Dict[str, Any]:
     """
     Make HTTP request to OpenAlex API with retry logic.
@@ -328,28 +576,60 @@ def make_request(url: str, params: Dict[str, Any], max_retries: int = 3) -> Dict
     """
     for attempt in range(max_retries):
         try:
-            response = requests.get(url, params=params, timeout=30)
+            response = _SESSION.get(url, params=params, timeout=30)
             
             if response.status_code == 429:
                 # Rate limit exceeded
-                retry_after = int(response.headers.get("Retry-After", 60))
+                _record_rate_limit(True)
+                retry_after = _parse_retry_after(response.headers.get("Retry-After"))
                 if attempt < max_retries - 1:
                     time.sleep(retry_after)
                     continue
-                raise RateLimitError(f"Rate limit exceeded. Retry after {retry_after} seconds.")
+                raise RateLimitError(f"Rate limit exceeded. Retry after {retry_after:g} seconds.")
             
             response.raise_for_status()
-            return response.json()
+            _record_rate_limit(False)
+            return _decode_json(response)
             
         except requests.exceptions.RequestException as e:
             if attempt < max_retries - 1:
-                time.sleep(2 ** attempt)  # Exponential backoff
+                # Exponential backoff, jittered so parallel workers don't retry in lockstep
+                time.sleep(2 ** attempt + random.uniform(0, 1))
                 continue
             raise OpenAlexAPIError(f"API request failed: {str(e)}")
     
     raise OpenAlexAPIError("Max retries exceeded")
 
 
+def _wait_for_request_slot() -> None:
+    """
+    Space out request starts, even across threads.
+
+    The spacing is MIN_REQUEST_INTERVAL scaled by the current backoff, so
+    it widens after rate limiting and returns to the polite rate once
+    requests succeed again.
+    """
+    global _next_request_time
+
+    with _request_time_lock:
+        now = time.monotonic()
+        start = max(now, _next_request_time)
+        _next_request_time = start + MIN_REQUEST_INTERVAL * _request_backoff
+    if start > now:
+        time.sleep(start - now)
+
+
+def _record_rate_limit(rate_limited: bool) -> None:
+    """Double the request spacing after a 429; ease it back by 5% per success."""
+    global _request_backoff
+
+    with _request_time_lock:
+        if rate_limited:
+            _request_backoff = min(_request_backoff * 2, MAX_REQUEST_BACKOFF)
+        elif _request_backoff > 1.0:
+            _request_backoff = max(_request_backoff * 0.95, 1.0)
+
+
 def search_works(
     search: Optional[str] = None,
     author_id: Optional[str] = None,
@@ -384,45 +664,38 @@ def search_works(
     page = 1
     per_page = min(per_page, MAX_PER_PAGE)
     
-    # Handle CSU-only filter: get all CSU authors first
+    # Handle CSU-only filter
     if csu_only:
-        print("Finding authors whose last known institution is Colorado State University...")
-        csu_author_ids = get_csu_author_ids(email, max_authors=5000)  # Get more authors
-        if not csu_author_ids:
-            print("Warning: No authors found with CSU as last known institution.", file=sys.stderr)
-            return []
-        
-        print(f"Found {len(csu_author_ids)} CSU authors. Using their IDs to filter works...")
-        # Add CSU author IDs to the author_ids list
         if author_ids:
-            # Combine with existing author IDs (intersection - both conditions must be true)
-            author_ids = [aid for aid in author_ids if aid in csu_author_ids]
+            # Check just the requested authors rather than fetching every CSU author
+            author_ids = filter_csu_author_ids(author_ids, email)
             if not author_ids:
                 print("No works found: specified authors are not CSU authors.", file=sys.stderr)
                 return []
         else:
             # Use all CSU authors
-            author_ids = csu_author_ids
+            print("Finding authors whose last known institution is Colorado State University...")
+            author_ids = get_csu_author_ids(email, max_authors=5000)  # Get more authors
+            if not author_ids:
+                print("Warning: No authors found with CSU as last known institution.", file=sys.stderr)
+                return []
+            print(f"Found {len(author_ids)} CSU authors. Using their IDs to filter works...")
     
     # Validate that at least one search parameter is provided
     if not any([search, author_id, author_ids, institution]):
         raise ValueError("At least one search parameter (search, author_id, author_ids, or institution) must be provided")
     
     # If we have many author IDs, we need to batch them (API has URL length limits)
-    # OpenAlex supports up to 100 author IDs per filter with OR logic, but URL length
-    # limits mean we need smaller batches (about 25-50 IDs per request)
-    MAX_AUTHORS_PER_FILTER = 25
-    
     if author_ids and len(author_ids) > MAX_AUTHORS_PER_FILTER:
         # Batch the author IDs and make multiple requests
         print(f"Batching {len(author_ids)} author IDs into groups of {MAX_AUTHORS_PER_FILTER}...")
-        all_results = []
-        
-        for i in range(0, len(author_ids), MAX_AUTHORS_PER_FILTER):
-            batch = author_ids[i:i + MAX_AUTHORS_PER_FILTER]
-            print(f"Processing batch {i // MAX_AUTHORS_PER_FILTER + 1} ({len(batch)} authors)...")
-            
-            batch_results = search_works(
+        batches = [
+            author_ids[i:i + MAX_AUTHORS_PER_FILTER]
+            for i in range(0, len(author_ids), MAX_AUTHORS_PER_FILTER)
+        ]
+
+        def search_batch(batch: List[str]) -> List[Dict[str, Any]]:
+            return search_works(
                 search=search,
                 author_id=None,
                 author_ids=batch,
@@ -434,28 +707,40 @@ def search_works(
                 per_page=per_page,
                 email=email
             )
-            
-            all_results.extend(batch_results)
-            
-            # Check if we've reached max results
-            if max_results > 0 and len(all_results) >= max_results:
-                all_results = all_results[:max_results]
-                break
-        
-        # Remove duplicates (same work might appear in multiple batches)
+
+        # Run up to MAX_BATCH_WORKERS batches at once, submitting the next one
+        # only as results are collected so we can stop early at max_results
+        all_results = []
+        # Remove duplicates as results arrive (same work might appear in multiple batches)
         seen_ids = set()
-        unique_results = []
-        for work in all_results:
-            work_id = work.get("id")
-            if work_id and work_id not in seen_ids:
-                seen_ids.add(work_id)
-                unique_results.append(work)
+        with ThreadPoolExecutor(max_workers=MAX_BATCH_WORKERS) as executor:
+            pending = deque()
+            next_batch = 0
+            while next_batch < len(batches) or pending:
+                while next_batch < len(batches) and len(pending) < MAX_BATCH_WORKERS:
+                    batch = batches[next_batch]
+                    next_batch += 1
+                    print(f"Processing batch {next_batch} ({len(batch)} authors)...")
+                    pending.append(executor.submit(search_batch, batch))
+
+                # Collect in submission order so results keep batch order
+                for work in pending.popleft().result():
+                    work_id = work.get("id")
+                    if work_id and work_id not in seen_ids:
+                        seen_ids.add(work_id)
+                        all_results.append(work)
+
+                # Check if we've reached max results
+                if max_results > 0 and len(all_results) >= max_results:
+                    all_results = all_results[:max_results]
+                    for future in pending:
+                        future.cancel()
+                    break
         
-        return unique_results
+        return all_results
     
     # Normal flow for smaller author lists
-    while True:
-        # Build query parameters
+    def fetch_page(page_number: int = 1, cursor: Optional[str] = None) -> Dict[str, Any]:
         params = build_query_params(
             search=search,
             author_id=author_id,
@@ -465,40 +750,65 @@ def search_works(
             fields=fields,
             sort=sort,
             per_page=per_page,
-            page=page,
-            email=email
+            page=page_number,
+            email=email,
+            cursor=cursor
         )
-        
-        # Make API request
-        response = make_request(BASE_URL, params)
-        
-        # Extract results
-        results = response.get("results", [])
-        if not results:
-            break
-        
-        all_results.extend(results)
-        
-        # Check if we've reached the max results limit
-        if max_results > 0 and len(all_results) >= max_results:
-            all_results = all_results[:max_results]
-            break
-        
-        # Check if there are more pages
-        # If we got fewer results than requested, we're on the last page
-        if len(results) < per_page:
-            break
-        
-        # Also check metadata if available
-        meta = response.get("meta", {})
-        count = meta.get("count", 0)
-        if count > 0 and len(all_results) >= count:
-            break
-        
-        page += 1
-        
-        # Small delay to be polite
-        time.sleep(0.1)
-    
-    return all_results
+        _wait_for_request_slot()
+        return make_request(BASE_URL, params)
 
+    # The first page tells us how many results there are in total
+    response = fetch_page(1)
+    results = response.get("results", [])
+    all_results = list(results)
+    count = response.get("meta", {}).get("count", 0)
+    wanted = min(count, max_results) if max_results > 0 else count
+
+    if wanted > MAX_PAGED_RESULTS:
+        # Too deep for page numbers: walk the whole result set by cursor.
+        # Cursor and page numbers can order tied works differently, so the
+        # walk starts again from "*" rather than continuing from page 1.
+        # Each page depends on the previous cursor, so this is sequential.
+        all_results = []
+        cursor = "*"
+        while cursor and len(all_results) < wanted:
+            response = fetch_page(cursor=cursor)
+            results = response.get("results", [])
+            if not results:
+                break
+            all_results.extend(results)
+            cursor = response.get("meta", {}).get("next_cursor")
+    elif len(results) == per_page and not count:
+        # No total to plan with: page on until a short page, as before
+        page_number = 1
+        while max_results <= 0 or len(all_results) < max_results:
+            page_number += 1
+            results = fetch_page(page_number).get("results", [])
+            all_results.extend(results)
+            if len(results) < per_page:
+                break
+    elif len(results) == per_page and count > per_page:
+        # Fetch the remaining pages concurrently; the request throttle keeps
+        # us within the polite rate while their latencies overlap. Only
+        # MAX_PAGE_WORKERS pages are in flight, so a short page stops the rest
+        last_page = math.ceil(wanted / per_page)
+        with ThreadPoolExecutor(max_workers=MAX_PAGE_WORKERS) as executor:
+            pending = deque()
+            next_page = 2
+            while next_page <= last_page or pending:
+                while next_page <= last_page and len(pending) < MAX_PAGE_WORKERS:
+                    pending.append(executor.submit(fetch_page, next_page))
+                    next_page += 1
+
+                # Collect in page order, whatever order they finish
+                results = pending.popleft().result().get("results", [])
+                all_results.extend(results)
+                if len(results) < per_page:
+                    for future in pending:
+                        future.cancel()
+                    break
+
+    if max_results > 0:
+        all_results = all_results[:max_results]
+
+    return all_results
@@ -22,6 +22,7 @@ setup(
     extras_require={
         "dev": ["pytest>=7.0"],
         "tavily": ["tavily-python>=0.3.0"],
+        "fast": ["orjson>=3.6"],
     },
     entry_points={
         "console_scripts": [
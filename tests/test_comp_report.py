@@ -6,8 +6,10 @@ from unittest.mock import patch
 
 from openalex_tool_pkg.comp_report import (
     _normalize_header,
+    iter_comp_report,
     parse_comp_report,
     get_unique_values,
+    get_unique_values_by_column,
     filter_rows,
     interactive_select,
     rows_to_author_entries,
@@ -88,6 +90,30 @@ class TestParseCompReport:
         with pytest.raises(ValueError, match="contains no data rows"):
             parse_comp_report(str(csv_file))
 
+    def test_only_pipeline_columns_kept(self, sample_rows):
+        assert set(sample_rows[0]) == {"Unit Name", "Department", "Last Name", "First Initial", "Job Title"}
+
+    def test_short_row_keeps_present_columns(self, tmp_path):
+        csv_file = tmp_path / "short.csv"
+        csv_file.write_text(
+            "Department,Last Name,First Initial,Job Title,Unit Name\n"
+            "Chemistry,Bernstein,B\n"
+        )
+        rows = parse_comp_report(str(csv_file))
+        assert rows == [{"Department": "Chemistry", "Last Name": "Bernstein", "First Initial": "B"}]
+
+    def test_blank_lines_skipped(self, tmp_path):
+        csv_file = tmp_path / "blank_lines.csv"
+        csv_file.write_text(
+            "Department,Last Name,First Initial,Job Title\n"
+            "\n"
+            "Chemistry,Bernstein,B,Professor\n"
+            "\n"
+        )
+        rows = parse_comp_report(str(csv_file))
+        assert len(rows) == 1
+        assert rows[0]["Last Name"] == "Bernstein"
+
     def test_row_fields(self, sample_rows):
         row = sample_rows[0]
         assert row["Last Name"] == "Brown"
@@ -161,6 +187,26 @@ class TestParseCompReport:
         assert rows[0]["First Initial"] == "B"
 
 
+# --- TestIterCompReport ---
+
+
+class TestIterCompReport:
+    def test_yields_rows_lazily(self, sample_csv_path):
+        rows = iter_comp_report(sample_csv_path)
+        first = next(rows)
+        assert first["Last Name"] == "Brown"
+        assert len(list(rows)) == 7
+
+    def test_matches_parse_comp_report(self, sample_csv_path):
+        assert list(iter_comp_report(sample_csv_path)) == parse_comp_report(sample_csv_path)
+
+    def test_headers_only_raises_after_last_row(self, tmp_path):
+        csv_file = tmp_path / "headers_only.csv"
+        csv_file.write_text("Department,Last Name,First Initial,Job Title\n")
+        with pytest.raises(ValueError, match="contains no data rows"):
+            list(iter_comp_report(str(csv_file)))
+
+
 # --- TestNormalizeHeader ---
 
 
@@ -222,6 +268,18 @@ class TestGetUniqueValues:
         assert titles.count("Resch Sci/Scholar II") == 1
 
 
+class TestGetUniqueValuesByColumn:
+    def test_matches_single_column(self, sample_rows):
+        result = get_unique_values_by_column(sample_rows, ("Department", "Job Title"))
+        assert result == {
+            "Department": get_unique_values(sample_rows, "Department"),
+            "Job Title": get_unique_values(sample_rows, "Job Title"),
+        }
+
+    def test_missing_column_is_empty(self, sample_rows):
+        assert get_unique_values_by_column(sample_rows, ("Nope",)) == {"Nope": []}
+
+
 # --- TestFilterRows ---
 
 
@@ -384,3 +442,15 @@ class TestLoadAndFilterCompReport:
     def test_file_not_found(self):
         with pytest.raises(FileNotFoundError):
             load_and_filter_comp_report("/nonexistent/report.csv")
+
+    def test_filters_stream_without_full_parse(self, sample_csv_path):
+        with patch("openalex_tool_pkg.comp_report.parse_comp_report") as mock_parse:
+            entries = load_and_filter_comp_report(sample_csv_path, department="Chemistry")
+        mock_parse.assert_not_called()
+        assert len(entries) == 2
+
+    def test_headers_only_with_filters_raises(self, tmp_path):
+        csv_file = tmp_path / "headers_only.csv"
+        csv_file.write_text("Department,Last Name,First Initial,Job Title\n")
+        with pytest.raises(ValueError, match="contains no data rows"):
+            load_and_filter_comp_report(str(csv_file), department="Chemistry")
@@ -10,6 +10,7 @@ from openalex_tool_pkg.config import (
     EXTENDED_FIELDS,
     ALL_FIELDS,
     FIELD_ALIASES,
+    SELECT_FIELDS,
 )
 
 
@@ -26,6 +27,11 @@ class TestResolveFieldName:
         assert resolve_field_name("author") == "authors"
         assert resolve_field_name("journal") == "sources"
 
+    def test_alias_shadowing_field_name(self):
+        # "open_access" is both a field and an alias; the alias wins
+        assert resolve_field_name("open_access") == "is_oa"
+        assert resolve_field_name("Open_Access") == "is_oa"
+
     def test_case_insensitive(self):
         assert resolve_field_name("Title") == "title"
         assert resolve_field_name("CITATIONS") == "cited_by_count"
@@ -37,6 +43,20 @@ class TestResolveFieldName:
         with pytest.raises(ValueError, match="Unknown field"):
             resolve_field_name("nonexistent_field")
 
+    def test_returns_canonical_string_object(self):
+        # User input is mapped back to the shared ALL_FIELDS strings
+        user_input = "".join([" Ti", "tle "])
+        assert resolve_field_name(user_input) is ALL_FIELDS[ALL_FIELDS.index("title")]
+
+
+class TestFieldTables:
+    def test_aliases_read_only(self):
+        with pytest.raises(TypeError):
+            FIELD_ALIASES["new_alias"] = "title"
+
+    def test_every_field_has_select_entry(self):
+        assert set(SELECT_FIELDS) == set(ALL_FIELDS)
+
 
 class TestGetDefaultFields:
     def test_returns_core_fields(self):
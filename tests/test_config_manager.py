@@ -37,14 +37,68 @@ class TestLoadConfig:
         assert config == {}
 
 
+class TestLoadConfigCache:
+    @pytest.fixture
+    def config_file(self, tmp_path):
+        config_file = tmp_path / "config.json"
+        with patch("openalex_tool_pkg.config_manager.CONFIG_DIR", tmp_path), \
+                patch("openalex_tool_pkg.config_manager.CONFIG_FILE", config_file):
+            yield config_file
+
+    def test_reuses_parsed_config(self, config_file):
+        config_file.write_text('{"email": "user@example.com"}')
+        with patch("openalex_tool_pkg.config_manager.json.load", wraps=json.load) as mock_load:
+            assert load_config() == {"email": "user@example.com"}
+            assert load_config() == {"email": "user@example.com"}
+        assert mock_load.call_count == 1
+
+    def test_returns_copy(self, config_file):
+        config_file.write_text('{"email": "user@example.com"}')
+        load_config()["email"] = "changed@example.com"
+        assert load_config()["email"] == "user@example.com"
+
+    def test_save_invalidates_cache(self, config_file):
+        config_file.write_text('{"email": "old@example.com"}')
+        assert load_config()["email"] == "old@example.com"
+        save_config({"email": "new@example.com"})
+        assert load_config()["email"] == "new@example.com"
+
+    def test_external_edit_detected(self, config_file):
+        config_file.write_text('{"email": "old@example.com"}')
+        assert load_config()["email"] == "old@example.com"
+        config_file.write_text('{"email": "edited.by.hand@example.com"}')
+        assert load_config()["email"] == "edited.by.hand@example.com"
+
+
 class TestSaveConfig:
+    @patch("openalex_tool_pkg.config_manager.os.replace")
     @patch("openalex_tool_pkg.config_manager.get_config_dir")
     @patch("builtins.open", mock_open())
-    def test_writes_config(self, mock_dir):
+    def test_writes_config(self, mock_dir, mock_replace):
         save_config({"email": "test@example.com"})
         handle = open
         # Verify open was called with the config file path
         handle.assert_called()
+        mock_replace.assert_called_once()
+
+    def test_atomic_replace(self, tmp_path):
+        config_file = tmp_path / "config.json"
+        config_file.write_text('{"email": "old@example.com"}')
+        with patch("openalex_tool_pkg.config_manager.CONFIG_DIR", tmp_path), \
+                patch("openalex_tool_pkg.config_manager.CONFIG_FILE", config_file):
+            save_config({"email": "new@example.com"})
+        assert json.loads(config_file.read_text()) == {"email": "new@example.com"}
+        assert list(tmp_path.iterdir()) == [config_file]
+
+    def test_failed_write_keeps_old_config(self, tmp_path):
+        config_file = tmp_path / "config.json"
+        config_file.write_text('{"email": "old@example.com"}')
+        with patch("openalex_tool_pkg.config_manager.CONFIG_DIR", tmp_path), \
+                patch("openalex_tool_pkg.config_manager.CONFIG_FILE", config_file):
+            with pytest.raises(TypeError):
+                save_config({"email": object()})
+        assert json.loads(config_file.read_text()) == {"email": "old@example.com"}
+        assert list(tmp_path.iterdir()) == [config_file]
 
 
 class TestGetEmail:
@@ -1,6 +1,10 @@
 """Tests for openalex_tool_pkg.formatter module."""
 
+import json
+import re
+
 import pytest
+from unittest.mock import patch
 from openalex_tool_pkg.formatter import (
     reconstruct_abstract_from_inverted_index,
     extract_authors,
@@ -9,6 +13,10 @@ from openalex_tool_pkg.formatter import (
     extract_keywords,
     extract_source,
     format_work,
+    build_format_plan,
+    apply_format_plan,
+    make_work_formatter,
+    write_json,
 )
 
 
@@ -28,6 +36,17 @@ class TestReconstructAbstract:
     def test_none_index(self):
         assert reconstruct_abstract_from_inverted_index(None) == ""
 
+    def test_gaps_in_positions(self):
+        inverted_index = {"Hello": [0], "world": [3]}
+        assert reconstruct_abstract_from_inverted_index(inverted_index) == "Hello world"
+
+    def test_duplicate_position_keeps_later_word(self):
+        inverted_index = {"Hello": [0], "there": [1], "world": [1]}
+        assert reconstruct_abstract_from_inverted_index(inverted_index) == "Hello world"
+
+    def test_empty_position_lists(self):
+        assert reconstruct_abstract_from_inverted_index({"orphan": []}) == ""
+
     def test_single_word(self):
         inverted_index = {"Abstract": [0]}
         assert reconstruct_abstract_from_inverted_index(inverted_index) == "Abstract"
@@ -89,6 +108,14 @@ class TestExtractAuthors:
         result = extract_authors(authorships, searched_author_ids=["A999"])
         assert result == []
 
+    def test_searched_author_ids_as_set(self):
+        authorships = [
+            self._make_authorship("A1", "Alice", position="first"),
+            self._make_authorship("A2", "Bob", position="middle"),
+        ]
+        result = extract_authors(authorships, searched_author_ids=frozenset({"A2"}))
+        assert result[0]["name"] == "Bob"
+
 
 class TestExtractInstitutions:
     def test_basic_extraction(self):
@@ -269,3 +296,99 @@ class TestFormatWork:
         work = self._make_work()
         result = format_work(work, ["publisher"])
         assert result["publisher"] == "Nature"
+
+    def test_sources_and_publisher_extract_source_once(self):
+        work = self._make_work()
+        with patch("openalex_tool_pkg.formatter.extract_source", wraps=extract_source) as mock_extract:
+            result = format_work(work, ["publisher", "sources"])
+        assert mock_extract.call_count == 1
+        assert result["publisher"] == "Nature"
+        assert result["source"]["name"] == "Nature"
+        assert list(result) == ["publisher", "source"]
+
+    def test_publisher_omitted_without_source(self):
+        work = self._make_work()
+        work["primary_location"] = {}
+        result = format_work(work, ["sources", "publisher"])
+        assert result == {"source": None}
+
+
+class TestBuildFormatPlan:
+    def test_plan_keys_follow_selected_order(self):
+        plan = build_format_plan(["title", "sources", "authors"])
+        assert [key for key, _ in plan] == ["title", "source", "authors"]
+
+    def test_plan_matches_format_work(self):
+        work = TestFormatWork()._make_work()
+        fields = ["id", "abstract", "authors", "institutions", "publisher", "sources", "language"]
+        plan = build_format_plan(fields, ["A1"])
+        assert apply_format_plan(work, plan) == format_work(work, fields, ["A1"])
+
+    def test_work_formatter_matches_format_work(self):
+        work = TestFormatWork()._make_work()
+        fields = ["title", "authors", "keywords", "publisher"]
+        format_one = make_work_formatter(fields)
+        assert format_one(work) == format_work(work, fields)
+
+    def test_plan_converts_searched_ids_to_set(self):
+        with patch("openalex_tool_pkg.formatter.extract_authors", return_value=[]) as mock_extract:
+            plan = build_format_plan(["authors"], ["A1", "A2"])
+            apply_format_plan({"authorships": []}, plan)
+        assert mock_extract.call_args[0][1] == frozenset({"A1", "A2"})
+
+    def test_plan_reused_across_works(self):
+        plan = build_format_plan(["title", "sources", "publisher"])
+        first = apply_format_plan({"title": "One", "primary_location": {"source": {"display_name": "Nature"}}}, plan)
+        second = apply_format_plan({"title": "Two", "primary_location": {}}, plan)
+        assert first["publisher"] == "Nature"
+        assert second == {"title": "Two", "source": None}
+
+
+class TestWriteJson:
+    def _expected(self, path, works, query_info):
+        with open(path, encoding="utf-8") as f:
+            written = json.load(f)
+        expected = {
+            "works": works,
+            "metadata": {
+                "total": len(works),
+                "timestamp": written["metadata"]["timestamp"],
+                "query": query_info or {},
+            },
+        }
+        return written, json.dumps(expected, indent=2, ensure_ascii=False)
+
+    def test_matches_json_dump_layout(self, tmp_path):
+        path = tmp_path / "out.json"
+        works = [
+            {"id": "W1", "title": "Caf\u00e9\nstudy", "authors": [{"id": "A1", "name": "Alice"}], "tags": []},
+            {"id": "W2", "title": None, "source": {}},
+        ]
+        write_json(works, str(path), {"search": "test"})
+        written, expected_text = self._expected(path, works, {"search": "test"})
+        assert written["works"] == works
+        assert path.read_text(encoding="utf-8") == expected_text
+
+    def test_stdlib_fallback_without_orjson(self, tmp_path):
+        path = tmp_path / "out.json"
+        works = [{"id": "W1", "title": "Caf\u00e9", "authors": []}]
+        with patch("openalex_tool_pkg.formatter.orjson", None):
+            write_json(works, str(path))
+        _, expected_text = self._expected(path, works, None)
+        assert path.read_text(encoding="utf-8") == expected_text
+
+    def test_integer_wider_than_64_bits(self, tmp_path):
+        path = tmp_path / "out.json"
+        works = [{"id": "W1", "cited_by_count": 2 ** 70}]
+        write_json(works, str(path))
+        written, expected_text = self._expected(path, works, None)
+        assert written["works"] == works
+        assert path.read_text(encoding="utf-8") == expected_text
+
+    def test_empty_works(self, tmp_path):
+        path = tmp_path / "out.json"
+        write_json([], str(path))
+        written, expected_text = self._expected(path, [], None)
+        assert written["metadata"]["total"] == 0
+        assert re.fullmatch(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z", written["metadata"]["timestamp"])
+        assert path.read_text(encoding="utf-8") == expected_text
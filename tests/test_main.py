@@ -0,0 +1,65 @@
+"""Tests for openalex_tool_pkg CLI entry point (openalex_tool_pkg/__init__.py)."""
+
+import os
+import subprocess
+import sys
+from unittest.mock import patch
+
+from openalex_tool_pkg import resolve_and_lookup_authors
+
+
+PACKAGE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _modules_loaded_after(code):
+    """Run code in a fresh interpreter and return the loaded module names."""
+    script = code + "\nimport sys\nprint('\\n'.join(sorted(sys.modules)))"
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=PACKAGE_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(result.stdout.split())
+
+
+class TestLazyImports:
+    HEAVY_MODULES = {
+        "requests",
+        "orjson",
+        "tavily",
+        "openalex_tool_pkg.openalex_client",
+        "openalex_tool_pkg.formatter",
+        "openalex_tool_pkg.name_resolver",
+        "openalex_tool_pkg.comp_report",
+    }
+
+    def test_package_import_is_light(self):
+        loaded = _modules_loaded_after("import openalex_tool_pkg")
+        assert not loaded & self.HEAVY_MODULES
+
+    def test_list_fields_is_light(self):
+        loaded = _modules_loaded_after(
+            "import contextlib, io, openalex_tool_pkg\n"
+            "with contextlib.redirect_stdout(io.StringIO()):\n"
+            "    openalex_tool_pkg.main(['--list-fields'])"
+        )
+        assert not loaded & self.HEAVY_MODULES
+
+
+class TestResolveAndLookupAuthors:
+    @patch("openalex_tool_pkg.openalex_client.lookup_author_ids_batch")
+    @patch("openalex_tool_pkg.name_resolver.resolve_abbreviated_name")
+    def test_repeated_entries_resolved_once(self, mock_resolve, mock_lookup):
+        mock_resolve.side_effect = lambda name, **kwargs: ("Eugene Kelly", True)
+        mock_lookup.return_value = {"Eugene Kelly": "https://openalex.org/A1"}
+        entries = [
+            {"name": "E. Kelly", "department": "Philosophy"},
+            {"name": "E. Kelly", "department": "Philosophy"},
+        ]
+
+        author_ids = resolve_and_lookup_authors(entries, None, None, True, "test-key")
+
+        assert mock_resolve.call_count == 1
+        assert author_ids == ["https://openalex.org/A1", "https://openalex.org/A1"]
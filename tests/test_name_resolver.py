@@ -1,15 +1,18 @@
 """Tests for openalex_tool_pkg.name_resolver module."""
 
 import os
+import sys
 import pytest
 from unittest.mock import patch, MagicMock
 from openalex_tool_pkg.name_resolver import (
     is_abbreviated_name,
     detect_file_format,
+    build_header_index,
     parse_author_line,
     get_tavily_api_key,
     extract_full_name_from_results,
     resolve_abbreviated_name,
+    _get_tavily_client,
 )
 
 
@@ -41,6 +44,18 @@ class TestIsAbbreviatedName:
     def test_initial_with_full_middle(self):
         assert is_abbreviated_name("E. Robert Kelly") is False
 
+    def test_non_ascii_initial(self):
+        assert is_abbreviated_name("É. Durand") is True
+
+    def test_digit_is_not_an_initial(self):
+        assert is_abbreviated_name("3. Kelly") is False
+
+    def test_surrounding_whitespace(self):
+        assert is_abbreviated_name("  E.  Kelly  ") is True
+
+    def test_detached_period_is_not_an_initial(self):
+        assert is_abbreviated_name("E . Kelly") is False
+
 
 class TestDetectFileFormat:
     def test_tsv_header_detected(self):
@@ -86,6 +101,14 @@ class TestParseAuthorLine:
         line = "Natural Sciences\tChemistry\t\tB"
         assert parse_author_line(line, headers) is None
 
+    def test_precomputed_header_index(self):
+        headers = ["College", "Department", "LastName", "FirstInitial", "Rank"]
+        index = build_header_index(headers)
+        assert index == {"college": 0, "department": 1, "lastname": 2, "firstinitial": 3, "rank": 4}
+        line = "Natural Sciences\tChemistry\tBernstein\tB\tProfessor"
+        assert parse_author_line(line, headers, index) == parse_author_line(line, headers)
+        assert parse_author_line(line, header_index=index)["name"] == "B. Bernstein"
+
     def test_tsv_no_first_initial(self):
         headers = ["College", "Department", "LastName", "FirstInitial"]
         line = "Natural Sciences\tChemistry\tSmith\t"
@@ -207,62 +230,65 @@ class TestResolveAbbreviatedName:
             assert name == "E. Kelly"
             assert resolved is False
 
-    def test_no_api_key_warns(self):
-        with patch("openalex_tool_pkg.name_resolver.is_abbreviated_name", return_value=True):
-            # Mock tavily import to succeed
-            mock_tavily = MagicMock()
-            with patch.dict("sys.modules", {"tavily": mock_tavily}):
-                with pytest.warns(match="No Tavily API key"):
-                    name, resolved = resolve_abbreviated_name("E. Kelly")
-                assert name == "E. Kelly"
-                assert resolved is False
-
-    def test_successful_resolution(self):
+    @pytest.fixture
+    def tavily_client(self, monkeypatch):
+        """Install a fake tavily module and return its TavilyClient instance."""
         mock_tavily_module = MagicMock()
-        mock_client = MagicMock()
-        mock_client.search.return_value = {
+        monkeypatch.setitem(sys.modules, "tavily", mock_tavily_module)
+        # Drop clients cached by earlier tests so this test gets the fake one
+        _get_tavily_client.cache_clear()
+        yield mock_tavily_module.TavilyClient.return_value
+        _get_tavily_client.cache_clear()
+
+    def test_no_api_key_warns(self, tavily_client):
+        with patch("openalex_tool_pkg.name_resolver.is_abbreviated_name", return_value=True):
+            with pytest.warns(match="No Tavily API key"):
+                name, resolved = resolve_abbreviated_name("E. Kelly")
+            assert name == "E. Kelly"
+            assert resolved is False
+
+    def test_successful_resolution(self, tavily_client):
+        tavily_client.search.return_value = {
             "answer": "Eugene Kelly is a professor at Colorado State University.",
             "results": [],
         }
-        mock_tavily_module.TavilyClient.return_value = mock_client
-
-        with patch.dict("sys.modules", {"tavily": mock_tavily_module}):
-            name, resolved = resolve_abbreviated_name(
-                "E. Kelly",
-                institution="Colorado State University",
-                department="Philosophy",
-                tavily_api_key="test-key",
-            )
+
+        name, resolved = resolve_abbreviated_name(
+            "E. Kelly",
+            institution="Colorado State University",
+            department="Philosophy",
+            tavily_api_key="test-key",
+        )
         assert name == "Eugene Kelly"
         assert resolved is True
 
-    def test_failed_resolution_returns_original(self):
-        mock_tavily_module = MagicMock()
-        mock_client = MagicMock()
-        mock_client.search.return_value = {
+    def test_failed_resolution_returns_original(self, tavily_client):
+        tavily_client.search.return_value = {
             "answer": "No information found.",
             "results": [],
         }
-        mock_tavily_module.TavilyClient.return_value = mock_client
 
-        with patch.dict("sys.modules", {"tavily": mock_tavily_module}):
-            name, resolved = resolve_abbreviated_name(
-                "E. Kelly",
-                tavily_api_key="test-key",
-            )
+        name, resolved = resolve_abbreviated_name(
+            "E. Kelly",
+            tavily_api_key="test-key",
+        )
         assert name == "E. Kelly"
         assert resolved is False
 
-    def test_tavily_search_exception(self):
-        mock_tavily_module = MagicMock()
-        mock_client = MagicMock()
-        mock_client.search.side_effect = Exception("API error")
-        mock_tavily_module.TavilyClient.return_value = mock_client
-
-        with patch.dict("sys.modules", {"tavily": mock_tavily_module}):
-            name, resolved = resolve_abbreviated_name(
-                "E. Kelly",
-                tavily_api_key="test-key",
-            )
+    def test_client_reused_across_names(self, tavily_client):
+        tavily_client.search.return_value = {"answer": "", "results": []}
+        tavily_module = sys.modules["tavily"]
+
+        resolve_abbreviated_name("E. Kelly", tavily_api_key="test-key")
+        resolve_abbreviated_name("J. Smith", tavily_api_key="test-key")
+        tavily_module.TavilyClient.assert_called_once_with(api_key="test-key")
+
+    def test_tavily_search_exception(self, tavily_client):
+        tavily_client.search.side_effect = Exception("API error")
+
+        name, resolved = resolve_abbreviated_name(
+            "E. Kelly",
+            tavily_api_key="test-key",
+        )
         assert name == "E. Kelly"
         assert resolved is False
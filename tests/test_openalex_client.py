@@ -4,15 +4,24 @@ import pytest
 from unittest.mock import patch, MagicMock
 from openalex_tool_pkg.openalex_client import (
     normalize_author_id,
+    to_openalex_url,
     build_query_params,
+    build_select_param,
     make_request,
     lookup_author_id,
+    lookup_author_ids_batch,
+    lookup_institution_id,
+    filter_csu_author_ids,
+    search_works,
     OpenAlexAPIError,
     RateLimitError,
+    _lookup_institution_id_cached,
+    _parse_retry_after,
     BASE_URL,
     AUTHORS_URL,
     DEFAULT_PER_PAGE,
     MAX_PER_PAGE,
+    MAX_PAGE_WORKERS,
 )
 
 
@@ -28,6 +37,13 @@ class TestNormalizeAuthorId:
         result = normalize_author_id("https://orcid.org/0000-0002-1825-0097")
         assert result == "https://orcid.org/0000-0002-1825-0097"
 
+    def test_orcid_with_x_checksum(self):
+        result = normalize_author_id("0000-0002-1694-233X")
+        assert result == "https://orcid.org/0000-0002-1694-233X"
+
+    def test_digits_wrong_length_passthrough(self):
+        assert normalize_author_id("0000-0002-1825") == "0000-0002-1825"
+
     def test_strips_whitespace(self):
         assert normalize_author_id("  A1234567890  ") == "A1234567890"
 
@@ -35,6 +51,17 @@ class TestNormalizeAuthorId:
         assert normalize_author_id("something_else") == "something_else"
 
 
+class TestToOpenalexUrl:
+    def test_bare_id_expanded(self):
+        assert to_openalex_url(" A1234567890 ") == "https://openalex.org/A1234567890"
+
+    def test_url_kept(self):
+        assert to_openalex_url("https://openalex.org/A1") == "https://openalex.org/A1"
+
+    def test_orcid_not_expanded(self):
+        assert to_openalex_url("0000-0002-1825-0097") == "https://orcid.org/0000-0002-1825-0097"
+
+
 class TestBuildQueryParams:
     def test_search_only(self):
         params = build_query_params(search="machine learning")
@@ -63,6 +90,11 @@ class TestBuildQueryParams:
         params = build_query_params(search="test", per_page=999)
         assert params["per_page"] == MAX_PER_PAGE
 
+    def test_cursor_replaces_page(self):
+        params = build_query_params(search="test", cursor="*")
+        assert params["cursor"] == "*"
+        assert "page" not in params
+
     def test_sort_param(self):
         params = build_query_params(search="test", sort="cited_by_count:desc")
         assert params["sort"] == "cited_by_count:desc"
@@ -80,8 +112,25 @@ class TestBuildQueryParams:
             build_query_params(institution="Nonexistent University")
 
 
+class TestBuildSelectParam:
+    def test_nested_fields_map_to_work_fields(self):
+        assert build_select_param(["title", "authors", "institutions", "abstract"]) == (
+            "abstract_inverted_index,authorships,id,title"
+        )
+
+    def test_fields_without_work_field_skipped(self):
+        assert build_select_param(["is_oa", "year"]) == "id"
+
+    def test_query_params_include_select(self):
+        params = build_query_params(search="test", fields=["doi", "publisher"])
+        assert params["select"] == "doi,id,primary_location"
+
+    def test_no_select_without_fields(self):
+        assert "select" not in build_query_params(search="test")
+
+
 class TestMakeRequest:
-    @patch("openalex_tool_pkg.openalex_client.requests.get")
+    @patch("openalex_tool_pkg.openalex_client._SESSION.get")
     def test_successful_request(self, mock_get):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -92,7 +141,27 @@ class TestMakeRequest:
         result = make_request("https://api.openalex.org/works", {"search": "test"})
         assert result == {"results": [{"id": "W1"}]}
 
-    @patch("openalex_tool_pkg.openalex_client.requests.get")
+    @patch("openalex_tool_pkg.openalex_client._SESSION.get")
+    def test_body_decoded_from_content(self, mock_get):
+        pytest.importorskip("orjson")
+        mock_response = MagicMock(status_code=200, content=b'{"results": [{"id": "W1"}]}')
+        mock_get.return_value = mock_response
+
+        result = make_request("https://api.openalex.org/works", {"search": "test"})
+        assert result == {"results": [{"id": "W1"}]}
+        mock_response.json.assert_not_called()
+
+    @patch("openalex_tool_pkg.openalex_client.orjson", None)
+    @patch("openalex_tool_pkg.openalex_client._SESSION.get")
+    def test_stdlib_fallback_without_orjson(self, mock_get):
+        mock_response = MagicMock(status_code=200)
+        mock_response.json.return_value = {"results": []}
+        mock_get.return_value = mock_response
+
+        assert make_request("https://api.openalex.org/works", {}) == {"results": []}
+
+    @patch("openalex_tool_pkg.openalex_client._request_backoff", 1.0)
+    @patch("openalex_tool_pkg.openalex_client._SESSION.get")
     def test_rate_limit_raises(self, mock_get):
         mock_response = MagicMock()
         mock_response.status_code = 429
@@ -102,7 +171,22 @@ class TestMakeRequest:
         with pytest.raises(RateLimitError):
             make_request("https://api.openalex.org/works", {}, max_retries=1)
 
-    @patch("openalex_tool_pkg.openalex_client.requests.get")
+    @patch("openalex_tool_pkg.openalex_client._request_backoff", 1.0)
+    @patch("openalex_tool_pkg.openalex_client.time.sleep")
+    @patch("openalex_tool_pkg.openalex_client._SESSION.get")
+    def test_rate_limit_widens_request_spacing(self, mock_get, mock_sleep):
+        from openalex_tool_pkg import openalex_client
+
+        limited = MagicMock(status_code=429, headers={"Retry-After": "1"})
+        ok = MagicMock(status_code=200)
+        ok.json.return_value = {"results": []}
+        mock_get.side_effect = [limited, ok]
+
+        make_request("https://api.openalex.org/works", {}, max_retries=2)
+        # One 429 doubles the spacing; the following success eases it back 5%
+        assert openalex_client._request_backoff == pytest.approx(1.9)
+
+    @patch("openalex_tool_pkg.openalex_client._SESSION.get")
     def test_api_error_raises(self, mock_get):
         import requests as req
 
@@ -112,6 +196,53 @@ class TestMakeRequest:
             make_request("https://api.openalex.org/works", {}, max_retries=1)
 
 
+class TestParseRetryAfter:
+    def test_seconds(self):
+        assert _parse_retry_after("2.5") == 2.5
+
+    def test_http_date(self):
+        from email.utils import format_datetime
+        from datetime import datetime, timedelta, timezone
+
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+        assert 25 <= _parse_retry_after(format_datetime(retry_at, usegmt=True)) <= 30
+
+    def test_past_date_is_zero(self):
+        assert _parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+    def test_missing_or_invalid_uses_default(self):
+        assert _parse_retry_after(None) == 60
+        assert _parse_retry_after("soon") == 60
+
+    def test_non_finite_uses_default(self):
+        assert _parse_retry_after("nan") == 60
+        assert _parse_retry_after("-inf") == 60
+
+    def test_capped(self):
+        assert _parse_retry_after("3600") == 60
+
+
+class TestLookupInstitutionId:
+    def setup_method(self):
+        _lookup_institution_id_cached.cache_clear()
+
+    @patch("openalex_tool_pkg.openalex_client.make_request")
+    def test_repeat_lookups_cached(self, mock_request):
+        mock_request.return_value = {"results": [{"id": "https://openalex.org/I1"}]}
+        assert lookup_institution_id("Some University") == "https://openalex.org/I1"
+        assert lookup_institution_id("Some University") == "https://openalex.org/I1"
+        assert mock_request.call_count == 1
+
+    @patch("openalex_tool_pkg.openalex_client.make_request")
+    def test_failures_not_cached(self, mock_request):
+        mock_request.side_effect = [
+            OpenAlexAPIError("fail"),
+            {"results": [{"id": "https://openalex.org/I1"}]},
+        ]
+        assert lookup_institution_id("Other University") is None
+        assert lookup_institution_id("Other University") == "https://openalex.org/I1"
+
+
 class TestLookupAuthorIdWithInstitution:
     @patch("openalex_tool_pkg.openalex_client.make_request")
     def test_institution_id_adds_filter(self, mock_request):
@@ -176,3 +307,234 @@ class TestLookupAuthorIdWithInstitution:
         )
         assert result == "https://openalex.org/A111"
         assert mock_request.call_count == 1
+
+
+class TestLookupAuthorIdsBatch:
+    @patch("openalex_tool_pkg.openalex_client.make_request")
+    def test_single_request_for_many_names(self, mock_request):
+        mock_request.return_value = {
+            "results": [
+                {"id": "https://openalex.org/A2", "display_name": "Bob Jones"},
+                {"id": "https://openalex.org/A1", "display_name": "Alice Smith"},
+            ]
+        }
+        result = lookup_author_ids_batch(["Alice Smith", "B. Jones"], email="me@example.com")
+        assert result == {
+            "Alice Smith": "https://openalex.org/A1",
+            "B. Jones": "https://openalex.org/A2",
+        }
+        assert mock_request.call_count == 1
+        params = mock_request.call_args[0][1]
+        assert params["filter"] == "display_name.search:Alice Smith|B. Jones"
+        assert params["mailto"] == "me@example.com"
+
+    @patch("openalex_tool_pkg.openalex_client.lookup_author_id")
+    @patch("openalex_tool_pkg.openalex_client.make_request")
+    def test_ambiguous_initials_fall_back(self, mock_request, mock_lookup):
+        mock_request.return_value = {
+            "results": [
+                {"id": "https://openalex.org/A1", "display_name": "Eugene Kelly"},
+                {"id": "https://openalex.org/A2", "display_name": "Edward Kelly"},
+            ]
+        }
+        mock_lookup.return_value = "https://openalex.org/A2"
+        result = lookup_author_ids_batch(["E. Kelly"])
+        assert result == {"E. Kelly": "https://openalex.org/A2"}
+        mock_lookup.assert_called_once_with("E. Kelly", None, None)
+
+    @patch("openalex_tool_pkg.openalex_client.lookup_author_id")
+    @patch("openalex_tool_pkg.openalex_client.make_request")
+    def test_full_name_requires_exact_match(self, mock_request, mock_lookup):
+        mock_request.return_value = {
+            "results": [
+                {"id": "https://openalex.org/A1", "display_name": "John Doe"},
+                {"id": "https://openalex.org/A2", "display_name": "J. Doe"},
+                {"id": "https://openalex.org/A3", "display_name": "jane doe"},
+            ]
+        }
+        result = lookup_author_ids_batch(["Jane Doe"])
+        assert result == {"Jane Doe": "https://openalex.org/A3"}
+        mock_lookup.assert_not_called()
+
+    @patch("openalex_tool_pkg.openalex_client.lookup_author_id")
+    @patch("openalex_tool_pkg.openalex_client.make_request")
+    def test_full_name_not_matched_by_same_initial(self, mock_request, mock_lookup):
+        mock_request.return_value = {
+            "results": [{"id": "https://openalex.org/A1", "display_name": "John Doe"}]
+        }
+        mock_lookup.return_value = None
+        result = lookup_author_ids_batch(["Jane Doe"])
+        assert result == {"Jane Doe": None}
+        mock_lookup.assert_called_once_with("Jane Doe", None, None)
+
+    @patch("openalex_tool_pkg.openalex_client.make_request")
+    def test_institution_filter_added(self, mock_request):
+        mock_request.return_value = {
+            "results": [{"id": "https://openalex.org/A1", "display_name": "Alice Smith"}]
+        }
+        lookup_author_ids_batch(["Alice Smith"], institution_id="https://openalex.org/I1")
+        params = mock_request.call_args[0][1]
+        assert "last_known_institutions.id:https://openalex.org/I1" in params["filter"]
+
+    @patch("openalex_tool_pkg.openalex_client.lookup_author_id")
+    @patch("openalex_tool_pkg.openalex_client.make_request")
+    def test_unmatched_names_fall_back(self, mock_request, mock_lookup):
+        mock_request.return_value = {
+            "results": [{"id": "https://openalex.org/A1", "display_name": "Alice Smith"}]
+        }
+        mock_lookup.return_value = None
+        result = lookup_author_ids_batch(["Alice Smith", "Carol White", "Smith"])
+        assert result["Alice Smith"] == "https://openalex.org/A1"
+        assert result["Carol White"] is None
+        assert result["Smith"] is None
+        looked_up = [c[0][0] for c in mock_lookup.call_args_list]
+        assert looked_up == ["Carol White", "Smith"]
+
+    @patch("openalex_tool_pkg.openalex_client.lookup_author_id")
+    @patch("openalex_tool_pkg.openalex_client.make_request")
+    def test_batch_failure_falls_back(self, mock_request, mock_lookup):
+        mock_request.side_effect = OpenAlexAPIError("bad request")
+        mock_lookup.return_value = "https://openalex.org/A9"
+        result = lookup_author_ids_batch(["Alice Smith"])
+        assert result == {"Alice Smith": "https://openalex.org/A9"}
+
+    @patch("openalex_tool_pkg.openalex_client.make_request")
+    def test_names_split_into_batches(self, mock_request):
+        names = [f"Author{i} Name{i}" for i in range(30)]
+        mock_request.side_effect = [
+            {"results": [{"id": f"https://openalex.org/A{i}", "display_name": n} for i, n in enumerate(names[:25])]},
+            {"results": [{"id": f"https://openalex.org/A{i + 25}", "display_name": n} for i, n in enumerate(names[25:])]},
+        ]
+        result = lookup_author_ids_batch(names)
+        assert mock_request.call_count == 2
+        assert result[names[29]] == "https://openalex.org/A29"
+
+
+class TestFilterCsuAuthorIds:
+    @patch("openalex_tool_pkg.openalex_client.lookup_csu_id", return_value="https://openalex.org/I92446798")
+    @patch("openalex_tool_pkg.openalex_client.make_request")
+    def test_keeps_csu_authors_in_order(self, mock_request, mock_csu):
+        mock_request.return_value = {"results": [{"id": "https://openalex.org/A1"}, {"id": "https://openalex.org/A3"}]}
+        author_ids = ["https://openalex.org/A3", "A9", "A1", "0000-0002-1825-0097"]
+        assert filter_csu_author_ids(author_ids) == ["https://openalex.org/A3", "A1"]
+        params = mock_request.call_args[0][1]
+        assert params["filter"] == "openalex:A3|A9|A1,last_known_institutions.id:https://openalex.org/I92446798"
+
+    @patch("openalex_tool_pkg.openalex_client.lookup_csu_id", return_value=None)
+    @patch("openalex_tool_pkg.openalex_client.make_request")
+    def test_no_csu_id(self, mock_request, mock_csu):
+        assert filter_csu_author_ids(["A1"]) == []
+        mock_request.assert_not_called()
+
+
+class TestSearchWorks:
+    @staticmethod
+    def _paged_responses(total, per_page):
+        """Return a make_request stand-in serving `total` works by page number."""
+        def respond(url, params):
+            assert "cursor" not in params
+            start = (params["page"] - 1) * per_page
+            ids = range(start, min(start + per_page, total))
+            return {"results": [{"id": f"W{i}"} for i in ids], "meta": {"count": total}}
+        return respond
+
+    @patch("openalex_tool_pkg.openalex_client.MIN_REQUEST_INTERVAL", 0)
+    @patch("openalex_tool_pkg.openalex_client.make_request")
+    def test_pages_returned_in_order(self, mock_request):
+        mock_request.side_effect = self._paged_responses(total=55, per_page=10)
+        works = search_works(search="x", per_page=10, max_results=0)
+        assert [w["id"] for w in works] == [f"W{i}" for i in range(55)]
+        assert mock_request.call_count == 6
+
+    @patch("openalex_tool_pkg.openalex_client.MIN_REQUEST_INTERVAL", 0)
+    @patch("openalex_tool_pkg.openalex_client.make_request")
+    def test_only_needed_pages_fetched(self, mock_request):
+        mock_request.side_effect = self._paged_responses(total=500, per_page=10)
+        works = search_works(search="x", per_page=10, max_results=25)
+        assert len(works) == 25
+        assert sorted(c[0][1]["page"] for c in mock_request.call_args_list) == [1, 2, 3]
+
+    @patch("openalex_tool_pkg.openalex_client.MIN_REQUEST_INTERVAL", 0)
+    @patch("openalex_tool_pkg.openalex_client.make_request")
+    def test_short_page_stops_fetching(self, mock_request):
+        serve = self._paged_responses(total=25, per_page=10)
+        def respond(url, params):
+            response = serve(url, params)
+            response["meta"]["count"] = 500  # Overstated total
+            return response
+        mock_request.side_effect = respond
+        works = search_works(search="x", per_page=10, max_results=0)
+        assert [w["id"] for w in works] == [f"W{i}" for i in range(25)]
+        assert mock_request.call_count <= 1 + MAX_PAGE_WORKERS
+
+    @patch("openalex_tool_pkg.openalex_client.MIN_REQUEST_INTERVAL", 0)
+    @patch("openalex_tool_pkg.openalex_client.make_request")
+    def test_missing_count_pages_sequentially(self, mock_request):
+        serve = self._paged_responses(total=25, per_page=10)
+        def respond(url, params):
+            response = serve(url, params)
+            del response["meta"]["count"]
+            return response
+        mock_request.side_effect = respond
+        works = search_works(search="x", per_page=10, max_results=0)
+        assert [w["id"] for w in works] == [f"W{i}" for i in range(25)]
+        assert [c[0][1]["page"] for c in mock_request.call_args_list] == [1, 2, 3]
+
+    @patch("openalex_tool_pkg.openalex_client.make_request")
+    def test_single_page(self, mock_request):
+        mock_request.side_effect = self._paged_responses(total=3, per_page=10)
+        works = search_works(search="x", per_page=10)
+        assert len(works) == 3
+        assert mock_request.call_count == 1
+
+    @patch("openalex_tool_pkg.openalex_client.make_request")
+    @patch("openalex_tool_pkg.openalex_client.filter_csu_author_ids")
+    @patch("openalex_tool_pkg.openalex_client.get_csu_author_ids")
+    def test_csu_only_checks_given_author_ids(self, mock_csu, mock_filter, mock_request):
+        mock_filter.return_value = ["A3", "A1"]
+        mock_request.return_value = {"results": [], "meta": {"count": 0}}
+        search_works(author_ids=["A3", "A9", "A1"], csu_only=True)
+        mock_csu.assert_not_called()
+        mock_filter.assert_called_once_with(["A3", "A9", "A1"], None)
+        filter_param = mock_request.call_args[0][1]["filter"]
+        assert filter_param == "authorships.author.id:https://openalex.org/A3|https://openalex.org/A1"
+
+    @patch("openalex_tool_pkg.openalex_client.MIN_REQUEST_INTERVAL", 0)
+    @patch("openalex_tool_pkg.openalex_client.make_request")
+    def test_author_batches_keep_order_and_dedup(self, mock_request):
+        def respond(url, params):
+            # One work per batch, keyed by the batch's first author, plus a shared work
+            first = params["filter"].split(":", 1)[1].split("|")[0].rsplit("/", 1)[-1]
+            return {"results": [{"id": f"W-{first}"}, {"id": "W-shared"}], "meta": {"count": 2}}
+        mock_request.side_effect = respond
+        author_ids = [f"A{i}" for i in range(60)]
+        works = search_works(author_ids=author_ids, max_results=0)
+        assert [w["id"] for w in works] == ["W-A0", "W-shared", "W-A25", "W-A50"]
+
+    @patch("openalex_tool_pkg.openalex_client.MIN_REQUEST_INTERVAL", 0)
+    @patch("openalex_tool_pkg.openalex_client.MAX_PAGED_RESULTS", 20)
+    @patch("openalex_tool_pkg.openalex_client.make_request")
+    def test_deep_results_use_cursor(self, mock_request):
+        def respond(url, params):
+            if "cursor" not in params:
+                # Page numbers order tied works differently from the cursor
+                return {"results": [{"id": f"W{i}"} for i in (1, 0, *range(2, 10))], "meta": {"count": 25}}
+            start = 0 if params["cursor"] == "*" else int(params["cursor"])
+            ids = range(start, min(start + 10, 25))
+            next_cursor = str(start + 10) if start + 10 < 25 else None
+            return {"results": [{"id": f"W{i}"} for i in ids], "meta": {"count": 25, "next_cursor": next_cursor}}
+        mock_request.side_effect = respond
+        works = search_works(search="x", per_page=10, max_results=0)
+        assert [w["id"] for w in works] == [f"W{i}" for i in range(25)]
+        assert [c[0][1].get("cursor") for c in mock_request.call_args_list] == [None, "*", "10", "20"]
+
+    @patch("openalex_tool_pkg.openalex_client.MIN_REQUEST_INTERVAL", 0)
+    @patch("openalex_tool_pkg.openalex_client.make_request")
+    def test_max_results_counts_unique_works(self, mock_request):
+        def respond(url, params):
+            first = params["filter"].split(":", 1)[1].split("|")[0].rsplit("/", 1)[-1]
+            return {"results": [{"id": "W-shared"}, {"id": f"W-{first}"}], "meta": {"count": 2}}
+        mock_request.side_effect = respond
+        author_ids = [f"A{i}" for i in range(60)]
+        works = search_works(author_ids=author_ids, max_results=3)
+        assert [w["id"] for w in works] == ["W-shared", "W-A0", "W-A25"]